@@ -375,7 +375,7 @@ class MapPlotter:
         Nc_line = np.full_like(betas, fill_value=float(nc_map_des), dtype=float)
         pts = np.column_stack([Nc_line, betas])  # shape (nBeta, 2)
 
-        wc_vals = self._map.get_map_wc(pts)  # RegularGridInterpolator supports array input
+        wc_vals = self._map.get_map_wc_eta_pr(pts)[:, 0]  # (Wc, Eta, PR) for each point
         wc_vals = np.asarray(wc_vals, dtype=float)
 
         idx = int(np.nanargmin(np.abs(wc_vals - float(wc_map_des))))
@@ -20,9 +20,13 @@ from gspy.core.base_component import TComponent
 import gspy.core.constants as c
 
 class TAmbient(TComponent):
+    # 2.0.0.5 attributes set by SetConditions, restored when SetConditions is called with unchanged conditions
+    _cached_attr_names = ('Altitude', 'Macha', 'dTs', 'Tsa', 'Psa', 'RH', 'H2O_mass_pct', 'H2O_vol_pct',
+                          'V', 'Tta', 'Pta')
+
     def __init__(self, owner, name, stationnr, Altitude, Macha, dTs, Psa, Tsa):
         super().__init__(owner, name, '', None)
-        self.station_nr = stationnr
+        self.set_station_nr(stationnr)
 
         # self.humidity_mode_des = None
         # self.humidity_value_des = None
@@ -31,6 +35,9 @@ class TAmbient(TComponent):
 
         self.Gas_Ambient = ct.Quantity(self.owner.gas)
         self.owner.gaspath_conditions[self.station_nr] = self.Gas_Ambient
+        self._prev_conditions = None
+        self._prev_state = None
+        self._prev_values = None
         self.SetConditions('DP', Altitude, Macha, dTs, Psa, Tsa, RH=None, H2O_mass_pct=None, H2O_vol_pct=None)
 
         owner.ambient = self
@@ -62,18 +69,30 @@ class TAmbient(TComponent):
             # self.humidity_value_des = hum_value
             self.H2O_mass_pct_des = H2O_mass_pct
             self.H2O_vol_pct = H2O_vol_pct
+
+        # 2.0.0.5 skip the standard atmosphere and Cantera gas state calculations if the
+        # conditions are the same as in the previous call (e.g. repeated OD points at
+        # the same flight condition), only restore the previous ambient gas state and
+        # attributes (these may have been changed in between, e.g. by setattr in TAMcontrol)
+        conditions = (Altitude, Macha, dTs, Psa, Tsa, RH, H2O_mass_pct, H2O_vol_pct)
+        if conditions == self._prev_conditions:
+            self.Gas_Ambient.state = self._prev_state
+            for attr_name, value in self._prev_values.items():
+                setattr(self, attr_name, value)
+            return
+
         self.Altitude = Altitude
         self.Macha = Macha
         self.dTs = dTs
-        if Tsa == None:
+        if Tsa is None:
             # Tsa not defined, use standard atmosphere
             self.Tsa = ac.std_atm.alt2temp(self.Altitude, alt_units='m', temp_units='K')
             # for standard atmosphere, use dTs if defined
-            if self.dTs != None:
+            if self.dTs is not None:
                 self.Tsa = self.Tsa + self.dTs
         else:
             self.Tsa = Tsa
-        if Psa == None:
+        if Psa is None:
             # Ps0 not defined, used standard atmosphere
             self.Psa = ac.std_atm.alt2press(self.Altitude, alt_units='m', press_units='pa')
         else:
@@ -86,6 +105,10 @@ class TAmbient(TComponent):
 
         self._set_gas_ambient_state()
 
+        self._prev_conditions = conditions
+        self._prev_state = self.Gas_Ambient.state
+        self._prev_values = {attr_name: getattr(self, attr_name) for attr_name in self._cached_attr_names}
+
         # for debug
         # for sp, y in zip(self.Gas_Ambient.phase.species_names, self.Gas_Ambient.phase.Y):
         #     if y > 1e-12:
@@ -119,11 +142,13 @@ class TAmbient(TComponent):
         a_s = self.Gas_Ambient.sound_speed
         self.V = self.Macha * a_s
 
-        self.Tta = self.Tsa * (1.0 + 0.5 * (gamma - 1.0) * self.Macha**2)
-        self.Pta = self.Psa * (self.Tta / self.Tsa)**(gamma / (gamma - 1.0))
+        # 2.0.0.5 total to static temperature ratio used for both Tta and Pta
+        Tt_Ts = 1.0 + 0.5 * (gamma - 1.0) * self.Macha * self.Macha
+        self.Tta = self.Tsa * Tt_Ts
+        self.Pta = self.Psa * Tt_Ts**(gamma / (gamma - 1.0))
 
-        # Total state, same composition
-        self.Gas_Ambient.TPX = self.Tta, self.Pta, X
+        # Total state, same composition: only T and P need to be set
+        self.Gas_Ambient.TP = self.Tta, self.Pta
 
     def _get_ambient_mole_fractions_from_static_conditions(self,
                                                            *,
@@ -262,22 +287,19 @@ class TAmbient(TComponent):
         # self.Gas_Ambient.TPY = self.Tta, self.Pta, c.s_air_composition_mass
         # self.V = self.Macha * ac.std_atm.temp2speed_of_sound(self.Tsa, speed_units = 'm/s', temp_units = 'K')
 
-        H2O_in_mass = self.Gas_Ambient.phase["H2O"].Y[0]
         return
 
      # 2.0.0.0
     def get_outputs(self):
         #  outputs = super().get_outputs()
-        s = self.station_nr
-
         return {
             "Alt": self.Altitude,
-            f"Ts{s}": self.Tsa,
-            f"Ps{s}": self.Psa,
-            f"Tt{s}": self.Tta,
-            f"Pt{s}": self.Pta,
-            f"Mach{s}": self.Macha,
-            f"RH{s}": self.RH
+            self._key_Ts: self.Tsa,
+            self._key_Ps: self.Psa,
+            self._key_Tt: self.Tta,
+            self._key_Pt: self.Pta,
+            self._key_Mach: self.Macha,
+            self._key_RH: self.RH
         }
 
     def get_station_nr(self):
@@ -285,3 +307,11 @@ class TAmbient(TComponent):
 
     def set_station_nr(self, station_nr):
         self.station_nr = station_nr
+        # 2.0.0.5 output table column names, composed here instead of in every get_outputs call
+        s = station_nr
+        self._key_Ts = f"Ts{s}"
+        self._key_Ps = f"Ps{s}"
+        self._key_Tt = f"Tt{s}"
+        self._key_Pt = f"Pt{s}"
+        self._key_Mach = f"Mach{s}"
+        self._key_RH = f"RH{s}"
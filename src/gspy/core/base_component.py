@@ -50,7 +50,7 @@ class TComponent(ABC):
         print(f"{self.name} ({Mode}) Point/Time:{PointTime}")
 
     def PlotMaps(self): # Plot performance in map(s)
-        if self.map != None:
+        if self.map is not None:
             self.map.PlotMap()
             print(f"{self.name} map with operating curve saved in {self.map.map_figure_file_path}")
 
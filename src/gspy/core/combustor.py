@@ -13,7 +13,6 @@
 # Author
 #   Wilfried Visser
 
-from scipy.optimize import root_scalar
 import numpy as np
 import cantera as ct
 
@@ -21,6 +20,15 @@ from gspy.core.gaspath import TGaspath
 import gspy.core.constants as c
 import gspy.core.utils as fu
 
+# 2.0.0.5 gri30 Solution for TCombustor.GetLHV, created on first use (parsing the yaml file is expensive)
+gri30_solution = None
+
+def get_gri30_solution():
+    global gri30_solution
+    if gri30_solution is None:
+        gri30_solution = ct.Solution('gri30.yaml')
+    return gri30_solution
+
 class TCombustor(TGaspath):
     def __init__(self, owner, name, MapFileName, ControlComponent, station_in, station_out, Wfdes, Texitdes, PRdes, Etades,
                  Tfueldes, LHVdes, HCratiodes, OCratiodes, FuelCompositiondes, A, 
@@ -65,6 +73,33 @@ class TCombustor(TGaspath):
         self.CO2_molar_mass = owner.gas.molecular_weights[owner.gas.species_index('CO2')]
         self.H2O_molar_mass = owner.gas.molecular_weights[owner.gas.species_index('H2O')]
 
+        # 2.0.0.5 species indices and mass array for the complete combustion products composition
+        self.product_species_indices = np.array([owner.gas.species_index(species) for species in ('O2', 'CO2', 'H2O', 'AR', 'N2')])
+        self.product_composition_mass = np.zeros(owner.gas.n_species)
+
+        # 2.0.0.5 species specific enthalpies (J/kg) at the reference temperature, for ideal gas (enthalpy
+        # independent of pressure) mixture reference enthalpies without setting the Cantera state
+        self.ideal_gas = owner.gas.thermo_model == 'ideal-gas'
+        if self.ideal_gas:
+            gas_ref = ct.Quantity(owner.gas)
+            gas_ref.TP = c.T_standard_ref, c.P_standard_ref
+            self.species_h_ref_mass = gas_ref.partial_molar_enthalpies / gas_ref.molecular_weights
+        else:
+            self.species_h_ref_mass = None
+
+        # 2.0.0.5 CHyOz virtual fuel mole mass and product factors, only recalculated if HCratio or OCratio changes
+        self.fuel_product_factors_ratios = None
+        self.CHyOzMoleMass = None
+        self.k_O2_fuel = None
+        self.k_CO2_fuel = None
+        self.k_H2O_fuel = None
+        # 2.0.0.5 product mass change per kg fuel for the product_species_indices species (O2, CO2, H2O, AR, N2)
+        self.fuel_product_factors = None
+
+        # 2.0.0.5 fuel mass fractions array, parsed from the FuelComposition string only when it changes
+        self.fuel_composition_parsed = None
+        self.fuel_composition_mass = None
+
     #  1.4 use separate routine, for allowing change of fuel for OD simulation cases
     def SetFuel(self, aTfuel, aLHV, aHCratio, aOCratio, aFuelComposition):
         self.Tfuel = aTfuel
@@ -74,26 +109,40 @@ class TCombustor(TGaspath):
         self.FuelComposition = aFuelComposition
         return
 
+    # 2.0.0.5 mass of O2 (consumed: negative), CO2 and H2O in the combustion products per kg of CHyOz virtual fuel,
+    # assuming complete combustion
+    def SetFuelProductFactors(self):
+        ratios = (self.HCratio, self.OCratio)
+        if ratios != self.fuel_product_factors_ratios:
+            self.CHyOzMoleMass = self.C_atom_weight + self.H_atom_weight * self.HCratio + self.O_atom_weight * self.OCratio
+            self.k_O2_fuel = (self.OCratio / 2.0 - 1.0 - self.HCratio / 4.0) * self.O2_molar_mass / self.CHyOzMoleMass
+            self.k_CO2_fuel = self.CO2_molar_mass / self.CHyOzMoleMass
+            self.k_H2O_fuel = self.H2O_molar_mass * self.HCratio / 2.0 / self.CHyOzMoleMass
+            self.fuel_product_factors = np.array([self.k_O2_fuel, self.k_CO2_fuel, self.k_H2O_fuel, 0.0, 0.0])
+            self.fuel_product_factors_ratios = ratios
+
     # 1.2 this routine is not actively used during simulation, but may be used separately
     #     to determine/compare LHV values or comparing values with vs without specified FuelComposion specified
     def GetLHV(self):
+        # 2.0.0.5 use a single gri30 Solution object, created on first use only
+        gas = get_gri30_solution()
+
         # Stoichiometric combustion of methane (CH4 + 2 O2 + 7.52 N2)
-        gas_reactants = ct.Solution('gri30.yaml')
-        gas_reactants.TPX = 298.15, ct.one_atm, {'CH4':1, 'O2':2, 'N2':7.52}
+        gas.TPX = 298.15, ct.one_atm, {'CH4':1, 'O2':2, 'N2':7.52}
 
         # Compute enthalpy of reactants
-        h_react = gas_reactants.enthalpy_mass
+        h_react = gas.enthalpy_mass
+
+        # Compute mass fraction of CH4 in the reactant mixture
+        Y_CH4 = gas.Y[gas.species_index('CH4')]
 
         # Define products for *complete combustion* (CO2 + 2 H2O + 7.52 N2)
-        gas_products = ct.Solution('gri30.yaml')
-        gas_products.TPX = 298.15, ct.one_atm, {'CO2':1, 'H2O':2, 'N2':7.52}
+        gas.TPX = 298.15, ct.one_atm, {'CO2':1, 'H2O':2, 'N2':7.52}
 
         # Enthalpy of products (H2O as vapor)
-        h_prod = gas_products.enthalpy_mass
+        h_prod = gas.enthalpy_mass
 
         # LHV (kJ/kg fuel)
-        # Compute mass fraction of CH4 in the reactant mixture
-        Y_CH4 = gas_reactants.Y[gas_reactants.species_index('CH4')]
         LHV = -(h_prod - h_react) / Y_CH4 / 1e3  # convert J/kg → kJ/kg
 
         self.owner.vprint(f"LHV of CH4 (H2O vapor): {LHV:.2f} kJ/kg")
@@ -249,7 +298,14 @@ class TCombustor(TGaspath):
             #     if y > 1e-12:
             #         print(f"{sp:8s} {y:.8f}")    
 
-            if (self.FuelComposition == '') or (self.FuelComposition == None):  # fuel specification based on LHV, HC and OC mole ratio
+            if self.Wf == 0:
+                # 2.0.0.5 no fuel flow (e.g. Wf clipped at 0 by the control): exit gas equals inlet gas,
+                # skip the combustion products and equilibrium calculation.
+                # Only at exactly 0, small and negative solver iterates (e.g. with Texit control) are calculated
+                # as before, keeping the exit conditions (errors) smooth in Wf for the solver
+                self.gas_out.TPY = Tin, Pin, Yin
+                self.gas_out.mass = w_air + self.Wf
+            elif (self.FuelComposition == '') or (self.FuelComposition is None):  # fuel specification based on LHV, HC and OC mole ratio
                 # combustion product mass fractions, assuming complete combustion and air/fuel equivalence ratio >= 1
 
                 #  2.0.0.1 bug fix: must use the actual gas composition of the incoming gas, not just assume dry air, 
@@ -262,47 +318,13 @@ class TCombustor(TGaspath):
                 # Ar_exit_mass = w_air * c.air_Ar_fraction_mass
                 # N2_exit_mass = w_air * c.air_N2_fraction_mass
 
-                Yin = self.gas_in.Y
-                w_gas_in = self.gas_in.mass
-
-                fuel_moles = self.Wf / CHyOzMoleMass
+                # 2.0.0.5 product masses directly in a mass fraction array at the O2, CO2, H2O, AR, N2 species
+                # indices (Cantera normalizes Y when set), instead of via a species name dictionary:
+                # inlet gas species masses plus the product mass change from the cached fuel product factors
+                product_composition_mass = self.product_composition_mass
+                product_composition_mass[self.product_species_indices] = (w_air * Yin[self.product_species_indices]
+                                                                          + self.Wf * self.fuel_product_factors)
 
-                O2_in_mass  = w_gas_in * self.gas_in.phase["O2"].Y[0]
-                CO2_in_mass = w_gas_in * self.gas_in.phase["CO2"].Y[0]
-                H2O_in_mass = w_gas_in * self.gas_in.phase["H2O"].Y[0]
-                AR_in_mass  = w_gas_in * self.gas_in.phase["AR"].Y[0]
-                N2_in_mass  = w_gas_in * self.gas_in.phase["N2"].Y[0]
-
-                O2_exit_mass = (
-                    O2_in_mass
-                    + fuel_moles
-                    * (self.OCratio / 2.0 - 1.0 - self.HCratio / 4.0)
-                    * self.O2_molar_mass
-                )
-
-                CO2_exit_mass = (
-                    CO2_in_mass
-                    + self.CO2_molar_mass * fuel_moles
-                )
-
-                H2O_exit_mass = (
-                    H2O_in_mass
-                    + self.H2O_molar_mass * fuel_moles * self.HCratio / 2.0
-                )
-
-                AR_exit_mass = AR_in_mass
-                N2_exit_mass = N2_in_mass
-
-                #  2.0 make dictionary, not string (avoid 1-d arrays instead of scalars)
-                # compose the composition string
-                # product_composition_mass = f'O2:{O2_exit_mass}, CO2:{CO2_exit_mass}, H2O:{H2O_exit_mass}, AR:{Ar_exit_mass}, N2:{N2_exit_mass}'
-                product_composition_mass = fu.scalar_dict({
-                    "O2": float(np.asarray(O2_exit_mass).squeeze()),
-                    "CO2": float(np.asarray(CO2_exit_mass).squeeze()),
-                    "H2O": float(np.asarray(H2O_exit_mass).squeeze()),
-                    "AR": float(np.asarray(AR_exit_mass).squeeze()),
-                    "N2": float(np.asarray(N2_exit_mass).squeeze()),
-                })
                 # for debug:
                 # print(type(product_composition_mass))
                 # print(product_composition_mass)
@@ -311,12 +333,18 @@ class TCombustor(TGaspath):
                 # so we can leave self.gas_in unchanged with the actual inlet composition, 
                 # and use self.gas_out to get the reference enthalpy of the inlet gas composition 
                 # at Tref and Pref, which is needed for the LHV-based calculation of the final enthalpy of the products after combustion
-                self.gas_out.TPY = c.T_standard_ref, c.P_standard_ref, self.gas_in.Y
-                h_gas_in_ref = self.gas_out.enthalpy_mass
-                
-                # now redefine gas_out for enthalpy of combustion products mixture at Pref and Tref of
-                self.gas_out.TPY = c.T_standard_ref, c.P_standard_ref, product_composition_mass
-                h_prod_ref = self.gas_out.enthalpy_mass # get H in J/kg
+                if self.ideal_gas:
+                    # 2.0.0.5 ideal gas: mixture enthalpy at Tref is the mass fraction weighted sum of the
+                    # cached species enthalpies at Tref, no Cantera state setting needed
+                    h_gas_in_ref = np.dot(Yin, self.species_h_ref_mass)
+                    h_prod_ref = np.dot(product_composition_mass, self.species_h_ref_mass) / product_composition_mass.sum()
+                else:
+                    self.gas_out.TPY = c.T_standard_ref, c.P_standard_ref, Yin
+                    h_gas_in_ref = self.gas_out.enthalpy_mass
+
+                    # now redefine gas_out for enthalpy of combustion products mixture at Pref and Tref of
+                    self.gas_out.TPY = c.T_standard_ref, c.P_standard_ref, product_composition_mass
+                    h_prod_ref = self.gas_out.enthalpy_mass # get H in J/kg
 
                 # now, calculate the final enthalpy of the products based on given LHV:
                 # from equation for conservation of energy ()"in = out"):
@@ -325,10 +353,11 @@ class TCombustor(TGaspath):
                 h_prod_final = (self.Wf * self.LHV * 1000 * self.Etades + w_air * (h_gas_in_initial-h_gas_in_ref)) / (w_air + self.Wf) + h_prod_ref
 
                 # now set exit gas_out H to h_prod_final, this will calculate gas_out.T
-                self.gas_out.HP = h_prod_final, Pin
+                # 2.0.0.5 set the products composition here too
+                self.gas_out.HPY = h_prod_final, Pin, product_composition_mass
 
                 # make sure fuel mass flow added to the inlet flow:
-                self.gas_out.mass = self.gas_in.mass + self.Wf
+                self.gas_out.mass = w_air + self.Wf
 
                 # 2.0
                 #  old self.gas_out.equilibrate('HP')
@@ -336,20 +365,30 @@ class TCombustor(TGaspath):
             else:                  # fuel specification based on FuelComposition and Tfuel
                 #  1.4 test if fuel exists (DP may be virtual flow, and OD composition specified, so....)
                 # if Mode == 'DP':
-                if self.fuel == None:
+                if self.fuel is None:
                     # create separate fuel quantity for mixing with gas_in
                     self.fuel = ct.Quantity(self.owner.gas)
                 self.fuel.mass = self.Wf
-                if self.Tfuel == None:      # assume Tfuel equal to T of air in
-                    Tfuelin = self.gas_in.T
+                if self.Tfuel is None:      # assume Tfuel equal to T of air in
+                    Tfuelin = Tin
                 else:                       # use user specified Tfuel
                     Tfuelin = self.Tfuel
                 # v1.2 set P fuel to Pout, otherwise (using gas_in.P, which is before the pressure loss)
                 #  the fuel pressure will increase the combustor pressure again with the TPY assignment
                 # self.fuel.TPY = Tfuelin, self.gas_in.P, self.FuelComposition
-                self.fuel.TPY = Tfuelin, Pin, self.FuelComposition
+                # 2.0.0.5 use the cached fuel mass fractions array, avoiding parsing the composition string every iteration
+                if self.FuelComposition != self.fuel_composition_parsed:
+                    self.fuel.TPY = Tfuelin, Pin, self.FuelComposition
+                    self.fuel_composition_mass = self.fuel.Y
+                    self.fuel_composition_parsed = self.FuelComposition
+                else:
+                    self.fuel.TPY = Tfuelin, Pin, self.fuel_composition_mass
                 # fuel.TPY = self.gas_in.T, self.gas_in.P, self.FuelComposition
-                self.gas_out = self.gas_in + self.fuel
+                # 2.0.0.5 mix gas_in and fuel in place into gas_out (same as gas_in + fuel, i.e. at constant U and V),
+                # instead of creating a new Quantity and reassigning self.gas_out every iteration
+                self.gas_out.state = self.gas_in.state
+                self.gas_out.mass = w_air
+                self.gas_out += self.fuel
 
                 # 1.3
                 if self.Etades < 1.000:
@@ -374,14 +413,18 @@ class TCombustor(TGaspath):
                     self.gas_out.HP = h_target, Pin
                 else:
                     # v1.2 reimpose pressure Pout to gas_out
-                    self.gas_out.HP = self.gas_out.enthalpy_mass, Pin
+                    # 2.0.0.5 ideal gas: same enthalpy means same temperature, so set T, P directly
+                    if self.ideal_gas:
+                        self.gas_out.TP = self.gas_out.T, Pin
+                    else:
+                        self.gas_out.HP = self.gas_out.enthalpy_mass, Pin
 
                 # 2.0
                 # self.gas_out.equilibrate("HP")
                 fu.robust_combustor_equilibrate(self.gas_out)
 
             # pressure loss
-            if (self.A == None) or (self.A ==0):
+            if (self.A is None) or (self.A ==0):
                 PRfund = 1
             else:
                 # PRfund = 1- self.fundamental_pressure_loss_rayleigh(self.A, self.gas_out.mass)
@@ -392,10 +435,14 @@ class TCombustor(TGaspath):
                     # may want to have option  to specify exit Mach instead and calculate A
                 PRfund = self.fundamental_pressure_loss_rayleigh(self.A)
             Pout = Pin * PRfund * self.PRdes
-            self.gas_out.HP = self.gas_out.enthalpy_mass, Pout
+            # 2.0.0.5 ideal gas: same enthalpy means same temperature, so set T, P directly
+            if self.ideal_gas:
+                self.gas_out.TP = self.gas_out.T, Pout
+            else:
+                self.gas_out.HP = self.gas_out.enthalpy_mass, Pout
 
-            # we redefined gas_out, so we must reassing self.gas_out to fsys.gaspath_conditions[self.station_out]
-            self.owner.gaspath_conditions[self.station_out] = self.gas_out
+            # 2.0.0.5 gas_out is no longer redefined (mixing is done in place), so the
+            # fsys.gaspath_conditions[self.station_out] reference set in TGaspath.Run remains valid
             return self.gas_out.T
 
         super().Run(Mode, PointTime)
@@ -403,16 +450,16 @@ class TCombustor(TGaspath):
         # self.GetLHV()
 
         if Mode == 'DP':
-            if self.Texitdes  != None: # calc Wf from Texit, use Wfdes as Wf first guess
+            if self.Texitdes is not None: # calc Wf from Texit, use Wfdes as Wf first guess
                 self.Texit = self.Texitdes  # now self.Wfdes is 1st guess for iteration to Text
             else:
                 self.Wf = self.Wfdes
         else:
             # v1.3
-            if self.control != None:
+            if self.control is not None:
                 # 1.4
                 # if self.Texit != None: # calc Wf from Texit
-                if (self.control.OD_controlled_parameter_name == None) and  (self.Texit != None): # calc Wf from Texit
+                if (self.control.OD_controlled_parameter_name is None) and  (self.Texit is not None): # calc Wf from Texit
                     self.Texit =  self.control.input_value
                 else:
                     self.Wf = self.control.input_value
@@ -422,17 +469,16 @@ class TCombustor(TGaspath):
 
         # this combustor has constant PR, no OD PR yet (use manual input in code here, or make PR map)
         self.PR = self.PRdes
-        Sin = self.gas_in.s
-        Pin = self.gas_in.P
+        # 2.0.0.5 inlet conditions read once, gas_in does not change during the Wf / Texit iteration
+        Tin, Pin, Yin = self.gas_in.TPY
         # Pout = self.gas_in.P*self.PRdes
-        Pin = self.gas_in.P
         w_air = self.gas_in.mass
         h_gas_in_initial = self.gas_in.enthalpy_mass
 
-        if (self.FuelComposition == '') or (self.FuelComposition == None):
-            CHyOzMoleMass = self.C_atom_weight + self.H_atom_weight * self.HCratio + self.O_atom_weight * self.OCratio
+        if (self.FuelComposition == '') or (self.FuelComposition is None):
+            self.SetFuelProductFactors()
 
-        if (self.control != None) and (self.control.OD_controlled_parameter_name == None) and  (self.Texit != None): # calc Wf from Texit
+        if (self.control is not None) and (self.control.OD_controlled_parameter_name is None) and  (self.Texit is not None): # calc Wf from Texit
             if Mode == 'DP':
                 # initial guess for Wf
                 Wf0 = self.Wfdes  # if Texit specified, Wfdes is initial guess
@@ -441,33 +487,41 @@ class TCombustor(TGaspath):
                 # define a state and error for subsequent OD solving for Wf making Texit match the self.Texit, e.g. set by a controller
                 # this is more stable than an internal separate loop for OD
                 # however, for DP, an internal secant solver is used to get the design Wfdes (only one iteration)
-                self.owner.states = np.append(self.owner.states, 1)
-                self.istate_Wf = self.owner.states.size-1
+                # 2.0.0.5 using add_state / add_error (DP lists) instead of np.append
+                self.istate_Wf = self.owner.add_state()
                 # error for equation Texit(Wf) = Text spec
-                self.owner.errors = np.append(self.owner.errors, 0)
-                self.ierror_Texit = self.owner.errors.size-1
+                self.ierror_Texit = self.owner.add_error()
 
                 def equation(Wfiter):
                     # 1.6.0.5
                     # self.Wf=Wfiter[0]
                     self.Wf=float(Wfiter)
                     return CalcEndConditions(PointTime) - self.Texit
-                solution = root_scalar(equation,
-
-                                        method = 'secant',
-                                        x0 = Wf0,  # Wf0 is guessed Wfdes here
-                                        x1 = 1.02 * Wf0,
-                                    xtol = 1e-6,
-                                    maxiter = 100
-                                    )
-                if solution.converged:
-                    self.Wf = solution.root
+                # 2.0.0.5 second point for the secant iteration from a Newton step with dTexit/dWf estimated
+                # from the energy balance: LHV * Eta heats the total flow, minus fuel heating from Tref to Texit
+                Texit_error0 = equation(Wf0)
+                cp_out = self.gas_out.cp_mass
+                dTexit_dWf = ((self.LHV * 1000 * self.Etades - cp_out * (self.gas_out.T - c.T_standard_ref))
+                              / ((w_air + Wf0) * cp_out)) if self.LHV is not None else 0
+                if dTexit_dWf > 0:
+                    Wf1 = Wf0 - Texit_error0 / dTexit_dWf
+                else:
+                    Wf1 = 1.02 * Wf0
+                # 2.0.0.5 plain secant iteration instead of root_scalar(method = 'secant')
+                Wf_root, converged = fu.secant_solve(equation,
+                                                     x0 = Wf0,  # Wf0 is guessed Wfdes here
+                                                     x1 = Wf1,
+                                                     f0 = Texit_error0,
+                                                     xtol = 1e-6,
+                                                     maxiter = 100)
+                if converged:
+                    self.Wf = Wf_root
                     self.Wfdes = self.Wf
                 else:
                     print(f"Wf for Combustor DP Texit value of {self.Texit:.0f} not found")
             else:
                 # initial OD guess for Wf, e.g. for when the first OD point is far from the DP operating condition
-                if self.Wf0_OD == None: # initialize reference value for OD
+                if self.Wf0_OD is None: # initialize reference value for OD
                     # assume Wf OD is proportional to the combustor inlet flow rate, e.g. when operating at high altitude while DP is at sea level
                     self.Wf0_OD = self.Wfdes * self.gas_in.mass / self.Wdes
                 self.Wf = self.owner.states[self.istate_Wf] * self.Wf0_OD
@@ -37,6 +37,10 @@ class TCompressor(TTurboComponent):
         self.PRdes = PRdes
         self.SpeedOption = SpeedOption
         self.Bleeds = Bleeds
+        # 2.0.0.5 create the bleed inflow gas_in quantities here, conditions are set in Run
+        if self.Bleeds is not None:
+            for bleed in self.Bleeds:
+                bleed.gas_in = ct.Quantity(owner.gas)
 
     # 1.6 virtual method CreateMap will be called in ancestor TTurboComponent
     # for either single map or series of maps in case of variable geometry with multipe maps for example
@@ -50,32 +54,31 @@ class TCompressor(TTurboComponent):
             self.ReadTurboMapAndSetScaling()
             # add states and errors
             if self.SpeedOption != 'CS':
-                if self.shaft.istate == None:
-                    self.owner.states = np.append(self.owner.states, 1)
-                    self.istate_n = self.owner.states.size-1
+                if self.shaft.istate is None:
+                    self.istate_n = self.owner.add_state()
                     self.shaft.istate = self.istate_n
                 else:
                     # already assigned (e.g. by fan or compressor upstream in the gas path)
                     self.istate_n = self.shaft.istate
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_beta = self.owner.states.size-1
+            self.istate_beta = self.owner.add_state()
             # error for equation gas_in.wc = wcmap
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_wc = self.owner.errors.size-1
+            self.ierror_wc = self.owner.add_error()
             # calculate parameters for output
             self.PR = self.PRdes
         else:  # i.e. OD s
             if self.SpeedOption != 'CS':
                 self.N = self.shaft.Nt
-            self.Nc = self.N / fu.GetRotorspeedCorrectionFactor(self.gas_in)
+            # 2.0.0.5 rotor speed and flow correction factors at once
+            rotorspeed_correction_factor, flow_correction_factor = fu.GetCorrectionFactors(self.gas_in)
+            self.Nc = self.N / rotorspeed_correction_factor
 
-            if self.control != None:
+            if self.control is not None:
                   self.vg_angle = self.control.Get_outputvalue_from_schedule(self.Nc)
             self.Wc, self.PR, self.Eta = self.GetTurboMapPerformance(self.vg_angle, self.Nc, self.owner.states[self.istate_beta])
 
             self.PW = fu.Compression(self.gas_in, self.gas_out, self.PR, self.Eta, self.Polytropic_Eta)
 
-            self.W = self.Wc / fu.GetFlowCorrectionFactor(self.gas_in)
+            self.W = self.Wc / flow_correction_factor
             self.owner.errors[self.ierror_wc ] = (self.W - self.gas_in.mass) / self.Wdes
 
             # set out flow rate to W according to map
@@ -88,22 +91,33 @@ class TCompressor(TTurboComponent):
         dHW_bleeds_total = 0
         dH = self.gas_out.enthalpy_mass - self.gas_in.enthalpy_mass
         dP = self.gas_out.P - self.gas_in.P
-        if self.Bleeds != None:
+        if self.Bleeds is not None:
+            # 2.0.0.5 compressor entry state and efficiency read once for all bleeds
+            Tin, Pin, Yin = self.gas_in.TPY
+            W = self.W
+            Eta = self.Eta
+            gaspath_conditions = self.owner.gaspath_conditions
             for bleed in self.Bleeds:
-                Wbleed = bleed.bleedfraction * self.W
+                Wbleed = bleed.bleedfraction * W
                 dW = dW + Wbleed
                 # dHW = dHW + (1 - bleed.dPfactor) * dH * Wbleed
-                if bleed.gas_in == None:
-                    #  define bleed inflow gas_in conditions
-                    bleed.gas_in = ct.Quantity(self.gas_in.phase, Wbleed)
-                else:
-                    bleed.gas_in.TPY = self.gas_in.T, self.gas_in.P, self.gas_in.Y
-                    bleed.gas_in.mass = Wbleed
+                #  set bleed inflow gas_in conditions
+                bleed.gas_in.TPY = Tin, Pin, Yin
+                bleed.gas_in.mass = Wbleed
                 #  add to station conditions dictionary
-                self.owner.gaspath_conditions[bleed.station_in] = bleed.gas_in
+                gaspath_conditions[bleed.station_in] = bleed.gas_in
 
                 # Compress Wbleed to bleed point
-                dHW1 = fu.Compression(self.gas_in, bleed.gas_in, (self.gas_in.P+dP*bleed.dPfactor)/self.gas_in.P, self.Eta, self.Polytropic_Eta)
+                # 2.0.0.5 no compression calculation needed for bleeds at compressor entry or exit
+                if bleed.dPfactor == 0:
+                    # bleed at entry conditions
+                    dHW1 = 0
+                elif bleed.dPfactor == 1:
+                    # bleed at exit conditions (same T, P as gas_out)
+                    bleed.gas_in.TP = self.gas_out.T, self.gas_out.P
+                    dHW1 = dH * Wbleed
+                else:
+                    dHW1 = fu.Compression(self.gas_in, bleed.gas_in, (Pin+dP*bleed.dPfactor)/Pin, Eta, self.Polytropic_Eta)
                 # now delta of compression power due to the bleed is
                 dHW2 = dH * Wbleed  - dHW1
                 dHW_bleeds_total = dHW_bleeds_total + dHW2
@@ -118,14 +132,14 @@ class TCompressor(TTurboComponent):
     # v1.2
     def PrintPerformance(self, Mode, PointTime):
         super().PrintPerformance(Mode, PointTime)
-        if self.Bleeds != None:
+        if self.Bleeds is not None:
             for bleed in self.Bleeds:
                 bleed.PrintPerformance(Mode, PointTime)
 
     # 2.0.0.0
     def get_outputs(self):
         out = super().get_outputs()
-        if self.Bleeds != None:
+        if self.Bleeds is not None:
             for bleed in self.Bleeds:
                 out.update(bleed.get_outputs())
         return out
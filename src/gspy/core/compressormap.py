@@ -17,6 +17,9 @@ import numpy as np
 from gspy.core.turbomap import TTurboMap
 
 class TCompressorMap(TTurboMap):
+    # 2.0.0.5 surge line data are cached with the other map data
+    map_data_names = TTurboMap.map_data_names + ('sl_wc_array', 'sl_pr_array')
+
     def __init__(self, host_component, name, MapFileName, OL_xcol, OL_Ycol, ShaftString, Ncmapdes, Betamapdes):
         super().__init__(host_component, name, MapFileName, OL_xcol, OL_Ycol, ShaftString, Ncmapdes, Betamapdes)
 
@@ -26,23 +26,16 @@ Air_composition = [
 # mole composition
 s_air_composition_mole = {sp: x for sp, _, x, _ in Air_composition}
 # mass composition
-s_air_composition_mass = {sp: y for sp, y, _, _ in Air_composition}
-
-s_air_composition_mass = ''
-# air_composition_moles = ''
-for species, massfraction, molefraction, O2_norm_molefraction in Air_composition:
-    # m_total = m_total + massfraction            should be 1.0 !
-    if s_air_composition_mass != '' :
-        s_air_composition_mass = s_air_composition_mass + ', '
-    s_air_composition_mass = s_air_composition_mass + species + ':' + str(massfraction)
-    # if air_composition_moles != '' :
-    #     air_composition_moles = air_composition_moles + ', '
-    # air_composition_moles = air_composition_moles + species + ':' + str(O2_norm_molefraction)
-# Accessing the tuple for 'O2' (finding the tuple by its first element)
-O2_tuple = next(item for item in Air_composition if item[0] == 'O2')
-CO2_tuple = next(item for item in Air_composition if item[0] == 'CO2')
-AR_tuple = next(item for item in Air_composition if item[0] == 'AR')
-N2_tuple = next(item for item in Air_composition if item[0] == 'N2')
+# 2.0.0.5 as 'species:massfraction, ...' string, built with a single join
+s_air_composition_mass = ', '.join(species + ':' + str(massfraction)
+                                   for species, massfraction, molefraction, O2_norm_molefraction in Air_composition)
+
+# 2.0.0.5 composition tuples by species name, for direct (dict) access to the tuple of a species
+Air_composition_by_species = {item[0]: item for item in Air_composition}
+O2_tuple = Air_composition_by_species['O2']
+CO2_tuple = Air_composition_by_species['CO2']
+AR_tuple = Air_composition_by_species['AR']
+N2_tuple = Air_composition_by_species['N2']
 
 air_O2_fraction_mass = O2_tuple[1]
 air_O2_fraction_moles = O2_tuple[2]
@@ -33,12 +33,12 @@ class TControl(TComponent):
         self.OD_point_step_value = OD_point_step_value
         self.OD_controlled_parameter_name = OD_controlled_parameter_name
         self.control_parameter_demand = None
-        if not ((OD_point_step_value == None) and (OD_end_value == None)): # single point input
+        if not ((OD_point_step_value is None) and (OD_end_value is None)): # single point input
             if (abs(OD_point_step_value) == 0) or ((OD_end_value - OD_start_value) * OD_point_step_value < 0):
                 raise Exception("Invalid control variable begin, end and step values")
 
     def get_OD_input_points(self):
-        if (self.OD_end_value == None) or (self.OD_point_step_value == None):
+        if (self.OD_end_value is None) or (self.OD_point_step_value is None):
             point_count = 1
         else:
             point_count = round(abs((self.OD_end_value - self.OD_start_value) / self.OD_point_step_value) + 1)
@@ -51,12 +51,12 @@ class TControl(TComponent):
             self.input_value = self.DP_input_value
         else:
             # 1.1 WV
-            if self.OD_controlled_parameter_name == None:
+            if self.OD_controlled_parameter_name is None:
                 # just simple open loop control
                 # 2.0 OK Allow single value input of OD_start_value only
                 # self.input_value = self.OD_start_value + self.OD_input_points[PointTime] * self.OD_point_step_value
                 self.input_value = self.OD_start_value # basic value
-                if not((self.OD_end_value == None) or (self.OD_point_step_value == None)):
+                if not((self.OD_end_value is None) or (self.OD_point_step_value is None)):
                     self.input_value = self.input_value + self.OD_input_points[PointTime] * self.OD_point_step_value
             else:
                 # input is coming from state, iterating toward value satisfying control equation
@@ -64,19 +64,18 @@ class TControl(TComponent):
             # 2.0 OK Allow single value input of OD_start_value only
             # self.control_parameter_demand = self.OD_start_value + self.OD_input_points[PointTime] * self.OD_point_step_value
             self.control_parameter_demand = self.OD_start_value
-            if not((self.OD_end_value == None) or (self.OD_point_step_value == None)):
+            if not((self.OD_end_value is None) or (self.OD_point_step_value is None)):
                 self.control_parameter_demand = self.control_parameter_demand + self.OD_input_points[PointTime] * self.OD_point_step_value
 
     # 1.1 WV PostRun evaluates the equation for controlling parameter named OD_controlledparName to input
     # note that anything calculated in PostRun will not end up in the output_dict !
     def PostRun(self, Mode, PointTime):
         # super().PostRun(Mode, PointTime)
-        if self.OD_controlled_parameter_name != None:
+        if self.OD_controlled_parameter_name is not None:
             if Mode == 'DP':
-                self.owner.states = np.append(self.owner.states, 1)
-                self.istate_control = self.owner.states.size-1
-                self.owner.errors = np.append(self.owner.errors, 0)
-                self.ierror_control = self.owner.errors.size-1
+                # 2.0.0.5 using add_state / add_error (DP lists) instead of np.append
+                self.istate_control = self.owner.add_state()
+                self.ierror_control = self.owner.add_error()
                 #  get control parameter DP value
                 self.DP_control_parameter_value = self.owner.output_dict[self.OD_controlled_parameter_name]
             else:
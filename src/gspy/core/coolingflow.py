@@ -65,9 +65,9 @@ class TCoolingFlow(TGaspath):
         print(f"\t\tTemperature : {self.gas_out.T:.1f} K")
         print(f"\t\tPressure    : {self.gas_out.P:.0f} Pa")
 
-        if self.DHWpump != None:
+        if self.DHWpump is not None:
             print(f"\t\tDHW rad pump : {self.DHWpump:.0f} kW")
-        if self.DHWexp != None:
+        if self.DHWexp is not None:
             print(f"\t\tDHW expansion: {self.DHWexp:.1f} kW")
 
     # 2.0.0.0
@@ -82,9 +82,9 @@ class TCoolingFlow(TGaspath):
         out[f"T{self.station_out}"]  = self.gas_out.T
         out[f"P{self.station_out}"]  = self.gas_out.P
 
-        if self.DHWpump != None:
+        if self.DHWpump is not None:
             out[f"DHWpump{self.station_out}"]  = self.DHWpump
-        if self.DHWexp != None:
+        if self.DHWexp is not None:
             out[f"DHWexp{self.station_out}"]  = self.DHWexp
 
         return out
\ No newline at end of file
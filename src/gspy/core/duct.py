@@ -13,7 +13,6 @@
 # Authors
 #   Wilfried Visser
 
-import numpy as np
 import cantera as ct
 # import gspy.core.sys_global as fg
 from gspy.core.gaspath import TGaspath
@@ -29,7 +28,11 @@ class TDuct(TGaspath):
     def Run(self, Mode, PointTime):
         super().Run(Mode, PointTime)
         # v1.2 dprel proportional to Wc^2
-        dprel = (1 - self.PRdes) * np.square(self.Wc/self.Wcdes)
+        # 2.0.0.5 plain float multiplication instead of np.square for the scalar Wc ratio
+        Wc_ratio = self.Wc/self.Wcdes
+        dprel = (1 - self.PRdes) * (Wc_ratio * Wc_ratio)
         self.PR = 1 - dprel
-        self.gas_out.TP = self.gas_in.T, self.gas_in.P*self.PR
+        # 2.0.0.5 single gas_in T, P read
+        Tin, Pin = self.gas_in.TP
+        self.gas_out.TP = Tin, Pin*self.PR
         return self.gas_out
\ No newline at end of file
@@ -13,10 +13,8 @@
 # Authors
 #   Wilfried Visser
 
-import numpy as np
 import cantera as ct
 import gspy.core.utils as fu
-from scipy.optimize import root_scalar
 from gspy.core.gaspath import TGaspath
 
 
@@ -32,6 +30,9 @@ class TExhaustDiffuser(TGaspath):
         super().__init__(owner, name, MapFileName, ControlComponent, station_in, station_out,
                          gas_out_output_species = gas_out_output_species)
         self.PRdes = PRdes
+        # 2.0.0.5 output names formatted once here instead of in every get_outputs call
+        self._key_T_out = f"T{station_out}"
+        self._key_P_out = f"P{station_out}"
 
     def Run(self, Mode, PointTime):
         super().Run(Mode, PointTime)
@@ -48,14 +49,16 @@ class TExhaustDiffuser(TGaspath):
         # diffuser with pressure loss, diffusing flow.
         # 1 - PR is rel. pressure loss proportional to Wc^2
         # in derived version, maybe make PR loss map
-        dprel = (1 - self.PRdes) * np.square(self.Wc/self.Wcdes)
+        # 2.0.0.5 plain float multiplication instead of np.square for the scalar Wc ratio
+        Wc_ratio = self.Wc/self.Wcdes
+        dprel = (1 - self.PRdes) * (Wc_ratio * Wc_ratio)
         self.PR = 1 - dprel
         if Mode == 'DP':
             # diffuser
             # use GasThroat as exit here
             self.GasThroat.TP = self.gas_in.T, Pout
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_p = self.owner.errors.size - 1
+            # 2.0.0.5
+            self.ierror_p = self.owner.add_error()
         else:
             # Off-design calculation
             # fsys.errors[self.ierror_p] = self.gas_in.P*self.PR / Pout
@@ -71,8 +74,7 @@ class TExhaustDiffuser(TGaspath):
 
     def get_outputs(self):
         out = super().get_outputs()
-        sout = self.station_out
-        out[f"T{sout}"]  = self.gas_out.T
-        out[f"P{sout}"]  = self.gas_out.P
+        # 2.0.0.5 T, P at exit
+        out[self._key_T_out], out[self._key_P_out] = self.gas_out.TP
 
         return out
\ No newline at end of file
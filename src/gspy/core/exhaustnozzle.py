@@ -14,10 +14,8 @@
 #   Wilfried Visser
 
 # v1.2 Propelling exhaust nozzle
-import numpy as np
 import cantera as ct
 import gspy.core.utils as fu
-from scipy.optimize import root_scalar
 from gspy.core.gaspath import TGaspath
 # import gspy.core.sys_global as fg
 
@@ -36,13 +34,28 @@ class TExhaustNozzle(TGaspath):
         self.CXdes = CXdes
         self.CVdes = CVdes
         self.CDdes = CDdes
+        # 2.0.0.5 output names formatted once here instead of in every get_outputs call
+        self._key_T_throat = f"T{stationthroat}"
+        self._key_P_throat = f"P{stationthroat}"
+        self._key_V_throat = f"V{stationthroat}"
+        self._key_Mach_throat = f"Mach{stationthroat}"
+        self._key_T_out = f"T{station_out}"
+        self._key_P_out = f"P{station_out}"
+        self._key_A_throat = f"A{stationthroat}"
+        self._key_A_throat_geom = f"A{stationthroat}_geom"
+        self._key_FG = "FG_"+name
 
     def Run(self, Mode, PointTime):
         super().Run(Mode, PointTime)
         # add nozzle throat station
-        self.GasThroat = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
-        Sin = self.gas_in.entropy_mass
-        Hin = self.gas_in.enthalpy_mass
+        # 2.0.0.5 create GasThroat in DP only, in OD reuse it with the gas_in state (as in TExhaustDiffuser)
+        if Mode == 'DP':
+            self.GasThroat = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
+            # 2.0.0.5 add the throat station once, OD updates the same GasThroat object
+            self.owner.gaspath_conditions[self.stationthroat] = self.GasThroat
+        else:
+            self.GasThroat.state = self.gas_in.state
+            self.GasThroat.mass = self.gas_in.mass
         Pin = self.gas_in.P
         Pout = self.owner.ambient.Psa
         # propelling nozzle, expansion flow
@@ -60,24 +73,47 @@ class TExhaustNozzle(TGaspath):
             if self.Mthroat > 1: # cannot be, correct for Mthroat = 1
                 self.Mthroat = 1
 
+                # 2.0.0.5 inlet entropy and enthalpy only needed here (not in OD)
+                Sin = self.gas_in.entropy_mass
+                Hin = self.gas_in.enthalpy_mass
+
                 # Function to find the pressure for Mach 1
+                # 2.0.0.5 also returns the derivative dM/dP for the Newton solver (instead of secant steps)
+                gas_throat = self.GasThroat
                 def mach_number_difference(exit_pressure):
 
                     # 1.6.0.5 make sure Pout becomes a single value
                     # self.GasThroat.SP = Sin, float(exit_pressure)  # Set state at the given pressure
-                    self.GasThroat.SP = Sin, float(np.asarray(exit_pressure).squeeze())  # Set state at the given pressure
-
-                    local_speed_of_sound = self.GasThroat.sound_speed
-                    velocity = (2 * (Hin - self.GasThroat.enthalpy_mass))**0.5
+                    # 2.0.0.5 fu.newton_solve passes exit_pressure as a single float value, no conversion needed
+                    gas_throat.SP = Sin, exit_pressure  # Set state at the given pressure
+                    # 2.0.0.5 read the properties from the phase object directly (each property read via
+                    # the Quantity first restores the Quantity state to the phase)
+                    throat = gas_throat.phase
+
+                    local_speed_of_sound = throat.sound_speed
+                    velocity = (2 * (Hin - throat.enthalpy_mass))**0.5
                     mach_number = velocity / local_speed_of_sound
-                    return mach_number - 1.0  # We want Mach number to be exactly 1
+                    # isentropic: dh/dP = 1/rho, so dV/dP = -1/(rho*V),
+                    # and (ideal gas, frozen gamma) da/dP = a * (gamma-1) / (2*gamma*P)
+                    gamma = throat.cp_mass / throat.cv_mass
+                    dmach_dP = (-1.0 / (throat.density * velocity * local_speed_of_sound)
+                                - mach_number * (gamma - 1.0) / (2.0 * gamma * exit_pressure))
+                    return mach_number - 1.0, dmach_dP  # We want Mach number to be exactly 1
                 # Use a numerical solver to find the exit pressure where Mach = 1
                 # rootresult = root_scalar(mach_number_difference, bracket=[0.1*Pout, Pin], method='brentq')
                 # use newton with 1.9 as guess for PR critical/choke to calculate initial exit_pressure
-                P0 = Pin/1.9
-                rootresult = root_scalar(mach_number_difference, x0=P0, method='newton')
-
-                self.Pthroat = rootresult.root
+                # P0 = Pin/1.9
+                # 2.0.0.5 use the ideal gas critical pressure with the inlet gamma as initial guess instead,
+                # but not below Pout, where M > 1 (full expansion is supersonic here)
+                gamma_in = self.gas_in.cp_mass / self.gas_in.cv_mass
+                P0 = max(Pin * (2.0 / (gamma_in + 1.0))**(gamma_in / (gamma_in - 1.0)), Pout)
+                # 2.0.0.5 plain Newton iteration instead of root_scalar(method = 'newton'),
+                # safeguarded with the root bracket: M > 1 at Pout and M < 1 (M = 0) at Pin.
+                # This avoids Newton steps to negative or above Pin pressures for hot gas / poor initial guess.
+                # 2.0.0.5 relative pressure tolerance 1e-8 (instead of the 1.48e-8 Pa default)
+                self.Pthroat, converged = fu.newton_solve(mach_number_difference, P0, xtol = 1e-8 * Pin, bracket = (Pout, Pin))
+                if not converged:
+                    print(f"{self.name}: DP nozzle throat pressure for Mach 1 not converged")
                 # 1.301 bug fix do not multiply with CVdes here. CXV is not supposed to affect Athroat and mass flow
                 # self.Vthroat = self.GasThroat.phase.sound_speed * self.CVdes
                 self.Vthroat = self.GasThroat.phase.sound_speed
@@ -88,8 +124,8 @@ class TExhaustNozzle(TGaspath):
                 self.Vthroat = Vthroat_is
             self.Tthroat = self.GasThroat.T
             # exit flow error
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_w = self.owner.errors.size - 1
+            # 2.0.0.5
+            self.ierror_w = self.owner.add_error()
             if self.Vthroat <= 0:
                 self.Vthroat = 0.001  # always assume a minimal flow velocity: 0.001 will result in a theoretical
                                     # very large exhaust area
@@ -112,7 +148,6 @@ class TExhaustNozzle(TGaspath):
         # add gross thrust to system level thrust (note that multiple propelling nozzles may exist)
         self.owner.FG = self.owner.FG + self.FG
         self.Athroat_geom = self.Athroat / self.CDdes
-        self.owner.gaspath_conditions[self.stationthroat] = self.GasThroat
         return self.gas_out
 
 
@@ -132,18 +167,14 @@ class TExhaustNozzle(TGaspath):
     def get_outputs(self):
         out = super().get_outputs()
 
-        sthr = self.stationthroat
-        sout = self.station_out
-
-        out[f"T{sthr}"]  = self.Tthroat
-        out[f"P{sthr}"]  = self.Pthroat
-        out[f"V{sthr}"]  = self.Vthroat
-        out[f"Mach{sthr}"]  = self.Mthroat
-        out[f"T{sout}"]  = self.gas_out.T
-        out[f"P{sout}"]  = self.gas_out.P
-        out[f"A{sthr}"]  = self.Athroat
-        out[f"A{sthr}_geom"]  = self.Athroat_geom
-        out["FG_"+self.name]  = self.FG
+        out[self._key_T_throat] = self.Tthroat
+        out[self._key_P_throat] = self.Pthroat
+        out[self._key_V_throat] = self.Vthroat
+        out[self._key_Mach_throat] = self.Mthroat
+        out[self._key_T_out], out[self._key_P_out] = self.gas_out.TP
+        out[self._key_A_throat] = self.Athroat
+        out[self._key_A_throat_geom] = self.Athroat_geom
+        out[self._key_FG] = self.FG
 
         return out
 
@@ -13,7 +13,6 @@
 # Authors
 #   Wilfried Visser
 
-import numpy as np
 import cantera as ct
 import gspy.core.utils as fu
 from gspy.core.turbo_component import TTurboComponent
@@ -71,6 +70,10 @@ class TFan(TTurboComponent):
         # 1.6
         self.cf = cf
 
+        # 2.0.0.5 duct exit and cross flow gas Quantities, created in the first DP run and reused after that
+        self.gas_out_duct = None
+        self.OD_crossFlow = None
+
     def GetSlWcValues(self):
         return self.sl_wc_array
 
@@ -79,13 +82,21 @@ class TFan(TTurboComponent):
 
     def Run(self, Mode, PointTime):
         super().Run(Mode, PointTime)
+        # 2.0.0.5 rotor speed and flow correction factors calculated once (gas_in does not change in Run)
+        rotorspeed_correction_factor, flow_correction_factor = fu.GetCorrectionFactors(self.gas_in)
 
         if Mode == 'DP':
             self.BPR = self.BPRdes
             # create gas_out_duct ct.Quantity here
-            self.gas_out_duct = ct.Quantity(self.gas_in.phase, mass = 1)
-            #  1.5
-            self.OD_crossFlow = ct.Quantity(self.gas_in.phase, mass = 1)
+            # 2.0.0.5 only once, repeated DP runs (e.g. DP target iterations) reuse the Quantities
+            #         (state and mass are set before use)
+            if self.gas_out_duct is None:
+                self.gas_out_duct = ct.Quantity(self.gas_in.phase, mass = 1)
+                #  1.5
+                self.OD_crossFlow = ct.Quantity(self.gas_in.phase, mass = 1)
+            # 2.0.0.5 design duct flow fraction and 1/Wdes, constant until the next DP run
+            self.duct_fraction_des = self.BPRdes / (self.BPRdes + 1.0)
+            self.inv_Wdes = 1.0 / self.Wdes
         else:
             self.BPR = self.owner.states[self.istate_BPR] * self.BPRdes
 
@@ -99,11 +110,12 @@ class TFan(TTurboComponent):
 
         # *********** Lucas Cf implementation ***********
         # design split (always based on BPRdes)
-        self.W_core_BPRdes = self.gas_in.mass / (self.BPRdes + 1.0)
-        self.W_duct_BPRdes = self.gas_in.mass * self.BPRdes / (self.BPRdes + 1.0)
+        W_in = self.gas_in.mass
+        self.W_core_BPRdes = W_in / (self.BPRdes + 1.0)
+        self.W_duct_BPRdes = W_in * self.duct_fraction_des
 
         # cross-flow due to BPR change (eq. 3-20)
-        self.crossflow = self.gas_in.mass * (self.BPR / (self.BPR + 1.0) - (self.BPRdes / (self.BPRdes + 1.0)))
+        self.crossflow = W_in * (self.BPR / (self.BPR + 1.0) - self.duct_fraction_des)
 
         # effective inlet flows for maps (eq. 3-21, 3-22)
         self.W_core_in = self.W_core_BPRdes - self.cf * self.crossflow
@@ -116,14 +128,14 @@ class TFan(TTurboComponent):
         if Mode == 'DP':
             # correct mass flow
             self.Wdes_core_in = self.W_core_in
-            self.Wcdes_core_in = self.Wdes_core_in * fu.GetFlowCorrectionFactor(self.gas_in)
+            self.Wcdes_core_in = self.Wdes_core_in * flow_correction_factor
             self.map_core.ReadMapAndGetScaling(self.Ncdes, self.Wcdes_core_in, self.PRdes_core, self.Etades_core)
             self.PW_core = fu.Compression(self.gas_in, self.gas_out, self.PRdes_core, self.Etades_core, self.Polytropic_Eta)
 
             # # add fan duct side compression
             # self.Wdes_duct = self.gas_in.mass - self.gas_out.mass
             self.Wdes_duct_in = self.W_duct_in
-            self.Wcdes_duct_in = self.W_duct_in * fu.GetFlowCorrectionFactor(self.gas_in)
+            self.Wcdes_duct_in = self.W_duct_in * flow_correction_factor
             self.map_duct.ReadMapAndGetScaling(self.Ncdes, self.Wcdes_duct_in, self.PRdes_duct, self.Etades_duct)
             self.PW_duct = fu.Compression(self.gas_in, self.gas_out_duct, self.PRdes_duct, self.Etades_duct, self.Polytropic_Eta)
 
@@ -131,25 +143,20 @@ class TFan(TTurboComponent):
             self.shaft.PW_sum = self.shaft.PW_sum - self.PW
 
             # add states and errors
+            # 2.0.0.5 using add_state / add_error (DP lists) instead of np.append
             #  rotor speed
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_n = self.owner.states.size-1
+            self.istate_n = self.owner.add_state()
             self.shaft.istate = self.istate_n
             # state for bypass ratio BPR
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_BPR = self.owner.states.size-1
+            self.istate_BPR = self.owner.add_state()
             #  map beta core
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_beta_core = self.owner.states.size-1
+            self.istate_beta_core = self.owner.add_state()
             # map beta duct
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_beta_duct = self.owner.states.size-1
+            self.istate_beta_duct = self.owner.add_state()
 
             # error for equation gas_in.mass = W (W according to map operating point)
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_wc_core = self.owner.errors.size-1
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_wc_duct = self.owner.errors.size-1
+            self.ierror_wc_core = self.owner.add_error()
+            self.ierror_wc_duct = self.owner.add_error()
 
             # calculate parameters for output
             self.PR_core  = self.PRdes_core
@@ -160,11 +167,12 @@ class TFan(TTurboComponent):
             self.Eta_duct = self.Etades_duct
 
         else:
-            self.N = self.owner.states[self.istate_n] * self.Ndes
-            self.Nc = self.N / fu.GetRotorspeedCorrectionFactor(self.gas_in)
+            states = self.owner.states
+            self.N = states[self.istate_n] * self.Ndes
+            self.Nc = self.N / rotorspeed_correction_factor
 
-            self.Wc_core, self.PR_core, self.Eta_core = self.map_core.GetScaledMapPerformance(self.Nc, self.owner.states[self.istate_beta_core])
-            self.Wc_duct, self.PR_duct, self.Eta_duct = self.map_duct.GetScaledMapPerformance(self.Nc, self.owner.states[self.istate_beta_duct])
+            self.Wc_core, self.PR_core, self.Eta_core = self.map_core.GetScaledMapPerformance(self.Nc, states[self.istate_beta_core])
+            self.Wc_duct, self.PR_duct, self.Eta_duct = self.map_duct.GetScaledMapPerformance(self.Nc, states[self.istate_beta_duct])
 
             self.PW_core = fu.Compression(self.gas_in, self.gas_out, self.PR_core, self.Eta_core, self.Polytropic_Eta)
             self.PW_duct = fu.Compression(self.gas_in, self.gas_out_duct, self.PR_duct, self.Eta_duct, self.Polytropic_Eta)
@@ -173,10 +181,10 @@ class TFan(TTurboComponent):
 
             self.shaft.PW_sum = self.shaft.PW_sum - self.PW
 
-            self.W_core = self.Wc_core / fu.GetFlowCorrectionFactor(self.gas_in)
-            self.owner.errors[self.ierror_wc_core ] = (self.W_core - self.W_core_in) / self.Wdes
-            self.W_duct = self.Wc_duct / fu.GetFlowCorrectionFactor(self.gas_in)
-            self.owner.errors[self.ierror_wc_duct ] = (self.W_duct - self.W_duct_in) / self.Wdes
+            self.W_core = self.Wc_core / flow_correction_factor
+            self.owner.errors[self.ierror_wc_core ] = (self.W_core - self.W_core_in) * self.inv_Wdes
+            self.W_duct = self.Wc_duct / flow_correction_factor
+            self.owner.errors[self.ierror_wc_duct ] = (self.W_duct - self.W_duct_in) * self.inv_Wdes
 
             # self.gas_out.mass = self.W_core  # self.gas_out = core flow = gas_out_core
             # self.gas_out_duct.mass = self.W_duct
@@ -202,7 +210,8 @@ class TFan(TTurboComponent):
                 self.gas_out.mass = self.gas_out.mass - crossflow_to_add
                 self.OD_crossFlow.mass = crossflow_to_add
                 self.OD_crossFlow.HP = fu.scalar(self.gas_out.enthalpy_mass), self.gas_out.P
-                self.gas_out_duct = self.gas_out_duct + self.OD_crossFlow
+                # 2.0.0.5 mix in place (+=), no new Quantity per run
+                self.gas_out_duct += self.OD_crossFlow
                 # 1.6.0.7 obsolete
                 # self.gas_out_duct.equilibrate("HP")
             else:
@@ -210,12 +219,15 @@ class TFan(TTurboComponent):
                 self.gas_out_duct.mass = self.gas_out_duct.mass + crossflow_to_add
                 self.OD_crossFlow.mass = - crossflow_to_add
                 self.OD_crossFlow.HP = fu.scalar(self.gas_out_duct.enthalpy_mass), self.gas_out_duct.P
-                self.gas_out = self.gas_out + self.OD_crossFlow
+                # 2.0.0.5 bug fix: mix in place (+=), gas_out must remain the object assigned to
+                #         gaspath_conditions[station_out] in TGaspath.Run, the new Quantity from + was not
+                #         seen by the downstream components (these got the core flow without the cross flow)
+                self.gas_out += self.OD_crossFlow
                 # 1.6.0.7 obsolete
                 # self.gas_out.equilibrate("HP")
 
         # calculate parameters for output
-        self.Wc = fu.scalar(self.gas_in.mass) * fu.GetFlowCorrectionFactor(self.gas_in)
+        self.Wc = fu.scalar(self.gas_in.mass) * flow_correction_factor
 
         # assigne gas_out_duct to gaspath_conditions dictionary, for the core flow already done in TGaspath parent class
         self.owner.gaspath_conditions[self.station_out_duct] = self.gas_out_duct
@@ -225,11 +237,11 @@ class TFan(TTurboComponent):
         super().PrintPerformance(mode, PointTime)
         print(f"\tRotor speed  : {self.N:.0f} rpm")
         print(f"\tCorr Rotor speed : {self.Nc:.0f} rpm")
-        if self.map_core != None:
+        if self.map_core is not None:
             print(f"\tCore Map:")
             self.print_map_data(self.map_core, mode)
 
-        if self.map_duct != None:
+        if self.map_duct is not None:
             print(f"\tDuct Map:")
             self.print_map_data(self.map_duct, mode)
 
@@ -267,7 +279,7 @@ class TFan(TTurboComponent):
 
     # override PlotMaps, to now plot the self.map_core and self.map_duct
     def PlotMaps(self): # Plot performance in map(s)
-        if self.map_core != None:
+        if self.map_core is not None:
             self.map_core.PlotMap()
             # 1.4
             # print(self.name + " core map with operating curve saved in " + self.map_core.map_figure_file_path)
@@ -277,7 +289,7 @@ class TFan(TTurboComponent):
             self.map_core.PlotDualMap('Eta_is_core_')
             print(f"{self.name} core map (dual) with operating curve saved in {self.map_core.map_figure_file_path}")
 
-        if self.map_duct != None:
+        if self.map_duct is not None:
             self.map_duct.PlotMap()
             # 1.4
             # print(self.name + " duct map with operating curve saved in " + self.map_duct.map_figure_file_path)
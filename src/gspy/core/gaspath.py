@@ -30,6 +30,7 @@ class TGaspath(TComponent):
         # set design properties to None, if still None in PrintPerformance,
         # then not assigned anywhere so no need to Print/output.
         self.gas_in = None
+        self.gas_inDes = None
         self.gas_out = None
         self.Wc = None
         self.PRdes = 1
@@ -42,13 +43,28 @@ class TGaspath(TComponent):
             for sp in self.gas_out_output_species
             ]
 
+        # 2.0.0.5 output table column names, composed once here instead of in every get_outputs call
+        self._key_W_in = f"W{station_in}"
+        self._key_T_in = f"T{station_in}"
+        self._key_P_in = f"P{station_in}"
+        self._key_Wc_in = f"Wc{station_in}"
+        self._key_PR = f"PR_{name}"
+        self._keys_Y_out = [f"Y{station_out}_{sp}" for sp in self.gas_out_output_species]
+
     def Run(self, Mode, PointTime):
         self.gas_in = self.owner.gaspath_conditions[self.station_in]
         
         if Mode == 'DP':
             # create gas_inDes, gas_out cantera Quantity (gas_in already created)
-            self.gas_inDes = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
-            self.gas_out = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
+            # 2.0.0.5 only in the first DP run, repeated DP runs (e.g. DP target iterations) reuse them
+            if self.gas_inDes is None:
+                self.gas_inDes = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
+                self.gas_out = ct.Quantity(self.gas_in.phase, mass = self.gas_in.mass)
+            else:
+                self.gas_inDes.state = self.gas_in.state
+                self.gas_inDes.mass = self.gas_in.mass
+                self.gas_out.state = self.gas_in.state
+                self.gas_out.mass = self.gas_in.mass
             self.Wdes = fu.scalar(self.gas_inDes.mass)
             self.Wcdes = self.Wdes * fu.GetFlowCorrectionFactor(self.gas_inDes)
             self.W = self.Wdes
@@ -56,7 +72,9 @@ class TGaspath(TComponent):
         else:
             self.W = fu.scalar(self.gas_in.mass)
             self.Wc = self.W * fu.GetFlowCorrectionFactor(self.gas_in)
-            self.gas_out.TPY = self.gas_in.TPY
+            # 2.0.0.5 copy the gas_in state vector (T, density, Y) directly, instead of a TPY get and set
+            #   that restores gas_in into the phase and then recalculates the gas_out state from T and P
+            self.gas_out.state = self.gas_in.state
             self.gas_out.mass = self.gas_in.mass
 
         self.owner.gaspath_conditions[self.station_out] = self.gas_out
@@ -68,13 +86,13 @@ class TGaspath(TComponent):
         print(f"\t\tMass flow  : {self.W:.2f} kg/s")
         print(f"\t\tTemperature: {self.gas_in.T:.1f} K")
         print(f"\t\tPressure   : {self.gas_in.P:.0f} Pa")
-        if self.Wcdes != None:
+        if self.Wcdes is not None:
             print(f"\tDP Corr.Mass flow  : {self.Wcdes:.2f} kg/s")
-        if self.Wc != None:
+        if self.Wc is not None:
             print(f"\tCorr.Mass flow  : {self.Wc:.2f} kg/s")
-        if self.PRdes != None:
+        if self.PRdes is not None:
             print(f"\tDP Pressure ratio  : {self.PRdes:.4f}")
-        if self.PR != None:
+        if self.PR is not None:
             print(f"\tPressure ratio  : {self.PR:.4f}")
         print(f"\tExit conditions:")
         print(f"\t\tTemperature: {self.gas_out.T:.1f} K")
@@ -108,23 +126,21 @@ class TGaspath(TComponent):
     def get_outputs(self):
         out = super().get_outputs()
 
-        s_in = self.station_in
-
-        out[f"W{s_in}"] = fu.scalar(self.gas_in.mass)
-        out[f"T{s_in}"] = self.gas_in.T
-        out[f"P{s_in}"] = self.gas_in.P
-        out[f"Wc{s_in}"] = self.Wc
+        # 2.0.0.5 column names composed in __init__, inlet T and P read at once
+        out[self._key_W_in] = fu.scalar(self.gas_in.mass)
+        out[self._key_T_in], out[self._key_P_in] = self.gas_in.TP
+        out[self._key_Wc_in] = self.Wc
 
         if self.PR is not None:
-            out[f"PR_{self.name}"] = self.PR
+            out[self._key_PR] = self.PR
 
         # 2.0.0.2
-        s_out = self.station_out
-        gas = self.gas_out.phase
-        Y = gas.Y
-        for sp, i in zip(self.gas_out_output_species,
-                        self.gas_out_output_species_indices):
-            out[f"Y{s_out}_{sp}"] = Y[i]            
+        # 2.0.0.5 gas_out composition only read if species output is requested
+        if self._keys_Y_out:
+            Y = self.gas_out.Y
+            for key, i in zip(self._keys_Y_out,
+                              self.gas_out_output_species_indices):
+                out[key] = Y[i]
 
         # out.update(self._get_species_outputs(self.gas_in, s_in, basis="mass"))
 
@@ -13,7 +13,6 @@
 # Authors
 #   Wilfried Visser
 
-import numpy as np
 import cantera as ct
 # import gspy.core.sys_global as fg
 import gspy.core.utils as fu
@@ -36,22 +35,24 @@ class TInlet(TGaspath):
             self.owner.gaspath_conditions[self.station_in].mass = self.Wdes
         super().Run(Mode, PointTime)
         # self.gas_in.TP = self.gas_in.T, self.gas_in.P
+        # 2.0.0.5 inlet T and P read once, the inlet gas state does not change in Run (only its mass)
+        Tin, Pin = self.gas_in.TP
         if Mode == 'DP':
             self.gas_in.mass = self.Wdes
-            self.wcdes = self.gas_in.mass * fu.GetFlowCorrectionFactor(self.gas_in)
+            self.wcdes = self.gas_in.mass * fu.GetFlowCorrectionFactorTP(Tin, Pin)
             self.wc = self.wcdes
             self.PR = self.PRdes
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_wc = self.owner.states.size-1   # add state for corrected inlet flow wc more stable... state staying closer to 1 at high altitude
+            # 2.0.0.5 using add_state (DP list) instead of np.append
+            self.istate_wc = self.owner.add_state()   # add state for corrected inlet flow wc more stable... state staying closer to 1 at high altitude
         else:
             self.wc = self.owner.states[self.istate_wc] * self.wcdes
             if self.wc < 0.001*self.wcdes:
                 self.wc = 0.001*self.wcdes
-            self.gas_in.mass = self.wc / fu.GetFlowCorrectionFactor(self.gas_in)
-            self.gas_out.TP = self.gas_in.T, self.gas_in.P * self.PRdes
+            self.gas_in.mass = self.wc / fu.GetFlowCorrectionFactorTP(Tin, Pin)
             # this inlet has constant PR, no OD PR yet (use manual input in code here, or make PR, Ram recovery map)
             self.PR = self.PRdes
-        self.gas_out.TP = self.gas_in.T, self.gas_in.P * self.PR
+        # 2.0.0.5 gas_out T, P set once (no longer also before with PRdes in OD)
+        self.gas_out.TP = Tin, Pin * self.PR
         self.gas_out.mass = self.gas_in.mass
         self.RD = self.gas_in.mass * self.owner.ambient.V / 1000 # kN
         # add ram drag to system level ram drag (note that multiple inlets may exist)
@@ -13,8 +13,9 @@
 # Authors
 #   Oscar Kogenhop
 
+import io
+import re
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.interpolate import RegularGridInterpolator
 from scipy.interpolate import griddata
 from scipy.interpolate import SmoothBivariateSpline
@@ -35,7 +36,10 @@ class TMap:
         self.map_dir_path = self.host_component.owner.maps_dir_path
 
         # the textIOwrapper into which the map file data are read
+        # 2.0.0.5 the map file is read into map_text at once, map_file is an in-memory
+        # text stream (io.StringIO) on map_text, positioned after the map header line
         self.map_file = None
+        self.map_text = None
 
         self.map_type = None
         self.map_title = None
@@ -68,27 +72,45 @@ class TMap:
     def simresultstable(self):
         return self.host_component.owner.output_table
 
+    # 2.0.0.5 return the map file path, raise FileNotFoundError right away if the map file does not exist
+    def GetMapFilePath(self, filename):
+        map_path = self.map_dir_path / filename
+        if not os.path.isfile(map_path):
+            raise FileNotFoundError(f"Map file '{map_path}' does not exist.")
+        return map_path
+
     def ReadMap(self, filename):              # Abstract method, defined by convention only
-        try:
-            # self.map_file = open(filename, 'r')
-            self.map_file = open(self.map_dir_path / filename, 'r')
-            # Read the first line
-            line = self.map_file.readline()
-            line_number = 1  # Initialize line number counter
-            while not '99' in line:
-                line = self.map_file.readline()
-            items = line.split()
-            self.map_type = items[0]
-            self.map_title = rest_of_items = ' '.join(items[1:])
-            return self.map_type, self.map_title, self.map_file
-
-        except FileNotFoundError:
-            print(f"Map file '{self.map_dir_path / filename}' does not exist.")
+        # 2.0.0.5 read the whole file in one go (file is closed again right away) and
+        # locate the header line directly in the text instead of scanning line by line
+        with open(self.GetMapFilePath(filename), 'r') as f:
+            self.map_text = f.read()
+        line, next_pos = self.FindMapTextLine('99', 0)
+        self.map_file = io.StringIO(self.map_text)
+        self.map_file.seek(next_pos)
+        items = line.split()
+        self.map_type = items[0]
+        self.map_title = rest_of_items = ' '.join(items[1:])
+        return self.map_type, self.map_title, self.map_file
+
+    # 2.0.0.5 find the first line in map_text, starting at text position pos, containing a match
+    # of regular expression pattern (case insensitive).
+    # Returns that line and the text position of the start of the next line.
+    def FindMapTextLine(self, pattern, pos):
+        match = re.compile(pattern, re.IGNORECASE).search(self.map_text, pos)
+        if match is None:
+            raise ValueError(f"'{pattern}' not found in map file '{self.map_filename}'")
+        line_start = self.map_text.rfind('\n', 0, match.start()) + 1
+        line_end = self.map_text.find('\n', match.end())
+        if line_end < 0:
+            line_end = len(self.map_text)
+        return self.map_text[line_start:line_end], line_end + 1
 
     # Map plotting routine
     def PlotMap(self):
         # Note; images are plotted in an output folder, if you use Windows, mind that a Windows Explorer feature treats this folder
         #       as a pictures folder, this means is doesnt update the cahnged date when images are overwritten!
         #       https://stackoverflow.com/questions/49039581/matplotlib-savefig-will-not-overwrite-old-files
+        # 2.0.0.5 pyplot imported on first use, keeps it out of the model import time
+        import matplotlib.pyplot as plt
         self.map_figure = plt.figure(num=self.name, figsize = self.map_size)
         self.main_plot_axis = self.map_figure.gca()
@@ -91,8 +91,8 @@ class TOneShaftComponent(TShaftComponent, ABC):
         self.power_w = None
 
         # Ensure shaft exists even if load is defined before turbomachinery
-        if all(shaft.shaft_id != shaft_id for shaft in owner.shaft_list):
-            owner.shaft_list.append(
+        if shaft_id not in owner.shaft_dict:
+            owner.add_shaft(
                 fshaft.TShaft(shaft_id, name + " shaft " + str(shaft_id))
             )
 
@@ -184,7 +184,7 @@ class TTwoShaftComponent(TShaftComponent, ABC):
         # by the gear ratio, so both shafts need to be defined before the gearbox
         # can be defined.
         required_shaft_ids = {drive_shaft_id, driven_shaft_id}
-        existing_shaft_ids = {shaft.shaft_id for shaft in owner.shaft_list}
+        existing_shaft_ids = owner.shaft_dict.keys()
 
         missing_ids = required_shaft_ids - existing_shaft_ids
 
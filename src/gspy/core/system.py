@@ -18,8 +18,10 @@ import numpy as np
 import pandas as pd
 import math
 import os
+import io
+import sys
+from contextlib import redirect_stdout
 import cantera as ct
-import matplotlib.pyplot as plt
 import cantera as ct
 import gspy.core.constants as c
 from pathlib import Path
@@ -100,6 +102,8 @@ class TSystemModel:
 
         self.component_run_list = [self.ambient] # system model component list, always starting with ambient
         self.shaft_list = []
+        # 2.0.0.5 shafts by shaft_id for O(1) existence checks and lookup, shaft_list keeps the shaft order
+        self.shaft_dict = {}
 
         self.input_points = np.array([], dtype=float)
         # self.points_output_interval = 1
@@ -146,11 +150,15 @@ class TSystemModel:
         # Do print to console!
         self.VERBOSE = True
 
+    # 2.0.0.5 add shafts via add_shaft to keep shaft_list and shaft_dict consistent
+    def add_shaft(self, shaft):
+        self.shaft_list.append(shaft)
+        self.shaft_dict[shaft.shaft_id] = shaft
+        return shaft
+
     def get_shaft(self, shaft_id):
-        for shaft in self.shaft_list:
-            if shaft.shaft_id == shaft_id:
-                return shaft
-        return None  # Return None if no matching object is found
+        # 2.0.0.5 direct lookup in shaft_dict, get_shaft is called in every Run of the shaft components
+        return self.shaft_dict.get(shaft_id)  # Return None if no matching object is found
 
     # find system model component object by name
     def get_comp(self, component_name):
@@ -166,15 +174,42 @@ class TSystemModel:
         return next((obj for obj in self.component_run_list if (isinstance(obj, TGaspath)) and (obj.station_in == astationnr)), None)
 
     def reinit_states_and_errors(self):
-        # global states, errors
-        for state in self.states:
-            state = 1
-        for error in self.errors:
-            state = 0
+        # 2.0.0.5 fill in place (assigning the loop variable left the arrays unchanged),
+        # the arrays are sized once by finalize_states_and_errors at the end of the DP run
+        self.finalize_states_and_errors()
+        self.states.fill(1.0)
+        self.errors.fill(0.0)
+
+    # 2.0.0.5 add a state (DP only), returns the state index.
+    # In the DP run, states and errors are collected in lists (append is O(1), np.append copies the
+    # whole array), finalize_states_and_errors converts them to numpy arrays at the end of the DP run
+    # User or extension components may still extend the states and errors with np.append in DP
+    # (self.owner.states = np.append(self.owner.states, ...)), add_state and add_error then
+    # continue from that array.
+    def add_state(self, value = 1.0):
+        if not isinstance(self.states, list):
+            # states array extended with np.append by a component in this DP run
+            self.states = list(self.states)
+        self.states.append(value)
+        return len(self.states) - 1
+
+    # 2.0.0.5 add an error (DP only), returns the error index
+    def add_error(self, value = 0.0):
+        if not isinstance(self.errors, list):
+            self.errors = list(self.errors)
+        self.errors.append(value)
+        return len(self.errors) - 1
+
+    # 2.0.0.5
+    def finalize_states_and_errors(self):
+        self.states = np.asarray(self.states, dtype=float)
+        self.errors = np.asarray(self.errors, dtype=float)
 
     def empty_states_and_errors(self):
-        self.states = np.empty(0, dtype=self.states.dtype)
-        self.errors = np.empty(0, dtype=self.errors.dtype)
+        # 2.0.0.5 float arrays, independent of the previous states and errors objects
+        # (these may still be DP lists if a previous DP run was aborted by an exception)
+        self.states = np.empty(0, dtype=float)
+        self.errors = np.empty(0, dtype=float)
 
     def reset_output(self):
         self._output_rows = []
@@ -194,34 +229,49 @@ class TSystemModel:
     # from inlet(s) through exhaust(s)
     def Do_Run(self, mode, point_time, states_par):
         # global system_model, states, errors, Ambient, Control
-        self.states = states_par.copy()
-        self.reinit_system()
+        if mode == 'DP':
+            # 2.0.0.5 states and errors are added again by the components in every DP run
+            # (e.g. repeated DP runs for DP target iteration), start with empty lists
+            self.states = []
+            self.errors = []
+            # reset shaft states (avoid skipping initialization of shaft states in case of multiple DP runs)
+            for shaft in self.shaft_list:
+                shaft.istate = None
+        else:
+            # 2.0.0.5 use the solver's state vector as is (no copy), the components only read the states
+            self.states = states_par
+        # 2.0.0.5 the DP states and errors lists are converted to arrays also if a component raises an exception
+        try:
+            self.reinit_system()
 
-        self.output_dict['Point/Time'] = point_time
-        self.output_dict['Mode'] = mode
-        self.output_dict['Description'] = self.descr
+            self.output_dict['Point/Time'] = point_time
+            self.output_dict['Mode'] = mode
+            self.output_dict['Description'] = self.descr
 
-        # 1.6 new PreRun virtual method
-        for comp in self.component_run_list:
-            comp.PreRun(mode, point_time)
+            # 1.6 new PreRun virtual method
+            for comp in self.component_run_list:
+                comp.PreRun(mode, point_time)
 
-        # 2.1
-        for shaft in self.shaft_list:
-            shaft.Run(mode, point_time)
+            # 2.1
+            for shaft in self.shaft_list:
+                shaft.Run(mode, point_time)
 
-        # Run simulation code of all components in the system model
-        for comp in self.component_run_list:
-            comp.Run(mode, point_time)
-            # load comp data into the output_dict
-            self.output_dict.update(comp.get_outputs())
+            # Run simulation code of all components in the system model
+            for comp in self.component_run_list:
+                comp.Run(mode, point_time)
+                # load comp data into the output_dict
+                self.output_dict.update(comp.get_outputs())
 
-        # load system performance (self) data into the output_dict
-        self.output_dict.update(self.get_outputs())
+            # load system performance (self) data into the output_dict
+            self.output_dict.update(self.get_outputs())
 
-        # note that anything calculated in PostRun will not end up in the output_dict !
-        # but can be added explicitly in PostRun implementations
-        for comp in self.component_run_list:
-            comp.PostRun(mode, point_time)
+            # note that anything calculated in PostRun will not end up in the output_dict !
+            # but can be added explicitly in PostRun implementations
+            for comp in self.component_run_list:
+                comp.PostRun(mode, point_time)
+        finally:
+            if mode == 'DP':
+                self.finalize_states_and_errors()
 
         return self.errors
 
@@ -240,9 +290,6 @@ class TSystemModel:
         try:
             # empty states and errors, so they can be added again for OD simulation after DP simulation 
             self.empty_states_and_errors()
-            # reset shaft states (avoid skipping initialization of shaft states in case of multiple DP runs)
-            for shaft in self.shaft_list:
-                shaft.istate = None
 
             if targets is None:
                 self.Do_Run('DP', 0, self.states)
@@ -292,7 +339,7 @@ class TSystemModel:
             print(f"DP simulation: exception error: {e}")
 
     def print_DP_equation_solution(self):
-        if self.targets != None:
+        if self.targets is not None:
             self.vprint(f"DP simulation equations solution:")
             for i, (varobj, varattr, targetobj, targetattr, targetvalue) in enumerate(self.targets):
                 self.vprint(f"\t{f'{targetobj.name}.{targetattr}':<26} = {targetvalue:>10} (target)   at {f'{varobj.name}.{varattr}':<26} = {f'{getattr(varobj, varattr)}':>22}")
@@ -326,6 +373,10 @@ class TSystemModel:
             maxiter=100
             successcount = 0
             failedcount = 0
+            # 2.0.0.5 each point starts from the solution of the previous point (self.states, set by the
+            # last residuals call), after a failed point from the last converged states instead.
+            # converged_states is a copy, independent of the state arrays passed to and returned by the solver
+            converged_states = self.states.copy()
             for point_time in self.input_points:
                 # solution returns the residual errors after conversion (shoudl be within the tolerance 'tol')
                 # fsys.Do_Output(Mode, input_points[ipoint])
@@ -352,13 +403,15 @@ class TSystemModel:
 
                     # if ipoint % self.points_output_interval == 0:
 
-                    self.Do_Output(point_time, self.no_error if solution.success else self.convergence_error)
+                    self.Do_Output(point_time, self.no_error if solution.success else self.no_convergence_error)
 
                     if solution.success:
                         successcount = successcount + 1
+                        converged_states = solution.x.copy()
                     else:
                         failedcount = failedcount + 1
                         print(f"Could not find a solution for point {point_time} with max {maxiter} iterations")
+                        self.states = converged_states.copy()
                 except Exception as e:
                     if rmax > self.error_tolerance:
                         error_index = self.false_convergence_error
@@ -367,6 +420,7 @@ class TSystemModel:
                     self.Do_Output(point_time, error_index)
                     failedcount = failedcount + 1
                     print(f"OD simulation: Error at point {point_time}: {e}")
+                    self.states = converged_states.copy()
                     if not self.continue_next_OD_point_on_error:
                         break
 
@@ -420,13 +474,20 @@ class TSystemModel:
     def Do_Output(self, point_time, error_code):
         # output to terminal
         if self.VERBOSE:
-            # 1.4
-            print(f"")
-            print(f"Point {point_time}:")
-
-            for comp in self.component_run_list:
-                comp.PrintPerformance(self.mode, point_time)
-            self.PrintPerformance(self.mode, point_time)
+            # 2.0.0.5 collect the performance print output of all components in a buffer
+            # and write it to the terminal at once (instead of many separate print calls)
+            print_buffer = io.StringIO()
+            try:
+                with redirect_stdout(print_buffer):
+                    # 1.4
+                    print(f"")
+                    print(f"Point {point_time}:")
+
+                    for comp in self.component_run_list:
+                        comp.PrintPerformance(self.mode, point_time)
+                    self.PrintPerformance(self.mode, point_time)
+            finally:
+                sys.stdout.write(print_buffer.getvalue())
 
         #  2.0
         self.output_dict['Comment'] = self.get_error_text(error_code)
@@ -455,6 +516,8 @@ class TSystemModel:
         self.vprint("output saved in "+outputcsvfilename)
 
     def Plot_X_nY_graph(self, title, filename_suffix, xcol, ycollist, do_show = False):
+        # 2.0.0.5 pyplot imported on first use, keeps it out of the model import time
+        import matplotlib.pyplot as plt
         self.prepare_output_table()
         # Plot output_tableable data
         # Create n subplots stacked vertically, sharing the same X-axis
@@ -51,7 +51,7 @@ class TTurbine(TTurboComponent):
         # (Exhast PR (off-design) actually is total to throat static PR)
         PRdesuntilAmbient = 1
         agaspathcomponent = self.owner.get_gaspathcomponent_object_inlet_stationnr(self.station_out)
-        while agaspathcomponent != None:
+        while agaspathcomponent is not None:
             PRdesuntilAmbient = PRdesuntilAmbient * agaspathcomponent.PRdes
             agaspathcomponent = self.owner.get_gaspathcomponent_object_inlet_stationnr(agaspathcomponent.station_out)
         return PRdesuntilAmbient
@@ -100,7 +100,9 @@ class TTurbine(TTurboComponent):
 
                 # add to main exit flow
                 Pout = self.gas_out.P
-                self.gas_out = self.gas_out + cf.gas_out
+                # 2.0.0.5 mix in place (+=), gas_out remains the object assigned to gaspath_conditions[station_out]
+                #         in TGaspath.Run (+ created a new Quantity that had to be assigned again after the mixing)
+                self.gas_out += cf.gas_out
                 # Because Cantera assumes you are physically combining two finite quantities of gas,
                 # so it recomputes the real thermodynamic result, not a mathematical average.
                 # That means:
@@ -123,7 +125,7 @@ class TTurbine(TTurboComponent):
             DHW_PR = fu.TurbineExpansion(self.gas_in, self.gas_out, PR_iter, self.Eta, None, self.Polytropic_Eta)
 
             # cooling flow effects
-            if self.CoolingFlows != None:
+            if self.CoolingFlows is not None:
                 self.dDHWcl, self.W_cl_eff = CalcCoolingFlowEffects()
                 DHW_PR = DHW_PR + self.dDHWcl
             else:
@@ -171,7 +173,7 @@ class TTurbine(TTurboComponent):
                 self.DHW = fu.TurbineExpansion(self.gas_in, self.gas_out, self.PRdes, self.Etades, None, self.Polytropic_Eta)
                 # v1.2
                 # cooling flow effects
-                if self.CoolingFlows != None:
+                if self.CoolingFlows is not None:
                     self.dDHWcl, self.W_cl_eff = CalcCoolingFlowEffects()
                     self.DHW = self.DHW + self.dDHWcl
 
@@ -181,10 +183,6 @@ class TTurbine(TTurboComponent):
                 # self.shaft.PW_sum = self.shaft.PW_sum + self.PW * self.Etamechdes
                 self.shaft.PW_sum = self.shaft.PW_sum + self.PW
 
-            # reset gas_out to gaspath_conditions dictionary (because link broken by adding cooling flow to gas_out
-            #                                                self.gas_out = self.gas_out + cf.gas_out)
-            self.owner.gaspath_conditions[self.station_out] = self.gas_out
-
             self.PWdes = self.PW
 
             # v1.2 recalculate self.Wcdes adding cooling flow
@@ -195,16 +193,14 @@ class TTurbine(TTurboComponent):
             self.ReadTurboMapAndSetScaling()
 
             # add states and errors
+            # 2.0.0.5 using add_state / add_error (DP lists) instead of np.append
             # rotor speed state is same as compressor's
-            self.owner.states = np.append(self.owner.states, 1)
-            self.istate_beta = self.owner.states.size-1
+            self.istate_beta = self.owner.add_state()
             # error for equation gas_in.wc = wcmap
-            self.owner.errors = np.append(self.owner.errors, 0)
-            self.ierror_wc = self.owner.errors.size-1
+            self.ierror_wc = self.owner.add_error()
             # shaft power error
             if self.TurbineType == 'GG':
-                self.owner.errors = np.append(self.owner.errors, 0)
-                self.ierror_shaftpw = self.owner.errors.size-1
+                self.ierror_shaftpw = self.owner.add_error()
             # calculate parameters for output
             self.N = self.Nc * fu.GetRotorspeedCorrectionFactor(self.gas_in)
         # ******************** end DP design mode *************************
@@ -213,17 +209,19 @@ class TTurbine(TTurboComponent):
         else:
             if self.TurbineType == 'GG':
                 self.N = self.owner.states[self.shaft.istate] * self.Ndes
-            self.Nc = self.N / fu.GetRotorspeedCorrectionFactor(self.gas_in)
+            # 2.0.0.5 rotor speed and flow correction factors at once
+            rotorspeed_correction_factor, flow_correction_factor = fu.GetCorrectionFactors(self.gas_in)
+            self.Nc = self.N / rotorspeed_correction_factor
 
             self.Wc, self.PR, self.Eta = self.map.GetScaledMapPerformance(self.Nc, self.owner.states[self.istate_beta])
-            self.W = self.Wc / fu.GetFlowCorrectionFactor(self.gas_in)
+            self.W = self.Wc / flow_correction_factor
 
             # 1.6.0.8 renaming: gross power excl. mech. losses = DHW (added), mechanical power output = PW
             # self.PW = fu.TurbineExpansion(self.gas_in, self.gas_out, self.PR, self.Eta, None, self.Polytropic_Eta)
             self.DHW = fu.TurbineExpansion(self.gas_in, self.gas_out, self.PR, self.Eta, None, self.Polytropic_Eta)
 
             # v1.2
-            if self.CoolingFlows != None:
+            if self.CoolingFlows is not None:
                 self.dDHWcl, self.W_cl_eff = CalcCoolingFlowEffects()
                 # 1.6.0.8 renaming: gross power excl. mech. losses = DHW (added), mechanical power output = PW
                 # self.PW = self.PW + self.dPWcl
@@ -239,9 +237,6 @@ class TTurbine(TTurboComponent):
             if self.TurbineType == 'GG':
                 self.owner.errors[self.ierror_shaftpw] = self.shaft.PW_sum / self.PWdes
 
-            # reset gas_out to gaspath_conditions dictionary (because link broken by adding cooling flow to gas_out
-            #                                                self.gas_out = self.gas_out + cf.gas_out)
-            self.owner.gaspath_conditions[self.station_out] = self.gas_out
         # ******************** end OD off design mode *************************
 
         return self.gas_out
@@ -249,7 +244,7 @@ class TTurbine(TTurboComponent):
     # v1.2
     def PrintPerformance(self, Mode, PointTime):
         super().PrintPerformance(Mode, PointTime)
-        if self.CoolingFlows != None:
+        if self.CoolingFlows is not None:
             for coolingflow in self.CoolingFlows:
                 coolingflow.PrintPerformance(Mode, PointTime)
 
@@ -257,7 +252,7 @@ class TTurbine(TTurboComponent):
     def get_outputs(self):
         out = super().get_outputs()
 
-        if self.CoolingFlows != None:
+        if self.CoolingFlows is not None:
             for coolingflow in self.CoolingFlows:
                 out.update(coolingflow.get_outputs())
 
@@ -17,6 +17,9 @@ import numpy as np
 from gspy.core.turbomap import TTurboMap
 
 class TTurbineMap(TTurboMap):
+    # 2.0.0.5 PR limit data are cached with the other map data
+    map_data_names = TTurboMap.map_data_names + ('prmin_array', 'prmax_array')
+
     def __init__(self, host_component, name, MapFileName, OL_xcol, OL_Ycol, ShaftString, Ncmapdes, Betamapdes):
         super().__init__(host_component, name, MapFileName, OL_xcol, OL_Ycol, ShaftString, Ncmapdes, Betamapdes)
         self.LegacyMap = False
@@ -25,6 +25,23 @@ from gspy.core.gaspath import TGaspath
 from pathlib import Path
 from gspy.core.turbomap import TTurboMap
 
+# 2.0.0.5 map data printed by print_map_data: (map attribute name, print format)
+#   optional values, printed only if not None
+map_data_print_formats = (
+    ('Ncmap',    "\tMap Corr Rotor speed : {:.4f} rpm"),
+    ('Wcmapdes', "\tDP Map Corr mass flow : {:.3f} kg/s"),
+    ('Wcmap',    "\tMap Corr mass flow : {:.3f} kg/s"),
+    ('PRmap',    "\tPR map : {:.4f}"),
+    ('Etamap',   "\tEta map : {:.4f}"),
+)
+#   map scaling factors, printed in DP
+map_scaling_print_formats = (
+    ('SFmap_Nc',  "\tSFmap Nc : {:.4f}"),
+    ('SFmap_Wc',  "\tSFmap Wc : {:.4f}"),
+    ('SFmap_PR',  "\tSFmap PR : {:.4f}"),
+    ('SFmap_Eta', "\tSFmap Eta: {:.4f}"),
+)
+
 class TTurboComponent(TGaspath):
     def __init__(self, owner, name, map_filename_or_dict, ControlComponent, station_in, station_out, shaft_id,
                  Ndes, Etades,
@@ -63,6 +80,16 @@ class TTurboComponent(TGaspath):
         # 1.6.0.8
         self.DHW = None
 
+        # 2.0.0.5 output table column names, composed once here instead of in every get_outputs call
+        self._key_N = f"N{shaft_id}"
+        self._key_Nc = f"Nc{station_in}"
+        self._key_N_pct = f"N{shaft_id}%"
+        self._key_Nc_pct = f"Nc{station_in}%"
+        self._key_Eta = "Eta_is_" + name
+        self._key_vg_angle = "vg_angle_" + name
+        self._key_TQ = "TQ" + name
+        self._key_PW = "PW_" + name
+
         # 1.6 Wilfried Visser, to accomodate multi-map functionality for variable geometry
         # VGparvalue is set from outside (manually of via TControl component) determining the maps in the MapFileNames list to be used for interpolation
         # type-dependent behavior for MapFileNames (renamed here from 'MapFileName' in TGaspath)
@@ -90,7 +117,7 @@ class TTurboComponent(TGaspath):
                     self.MapFileName = fn                   # mapfile used for scaling
             self.vg_angles = sorted(self.maps_by_angle)
 
-            if self.MapFileName == None:
+            if self.MapFileName is None:
                 raise TypeError(
                     "VGparvaluedes does not match any of the VGpasvalue's in the MapFileNames list")
 
@@ -107,11 +134,11 @@ class TTurboComponent(TGaspath):
             )
 
         # 2.1 if shaft not existing yet, create shaft and assume shaft Ntdes = Ndes, assign I = 0 here (specify turbomachinery with an I value)
-        if all(shaft.shaft_id != shaft_id for shaft in self.owner.shaft_list):
-            self.owner.shaft_list.append(fshaft.TShaft(self.owner, shaft_id, name + ' shaft ' + str(shaft_id),
-                                                       self.Ndes, # shaft design speed
-                                                       0          # shaft moment of inertia kg.m2
-                                                       ) )
+        if shaft_id not in self.owner.shaft_dict:
+            self.owner.add_shaft(fshaft.TShaft(self.owner, shaft_id, name + ' shaft ' + str(shaft_id),
+                                               self.Ndes, # shaft design speed
+                                               0          # shaft moment of inertia kg.m2
+                                               ) )
 
     # 1.6 WV
     # @abstractmethod  not abstract: not implemented in TFan child class
@@ -121,7 +148,7 @@ class TTurboComponent(TGaspath):
 
     # 1.6 WV
     def ReadTurboMapAndSetScaling(self):
-        if self.maps_by_angle == None:  # single map only in map object
+        if self.maps_by_angle is None:  # single map only in map object
             self.map.ReadMapAndGetScaling(self.Ncdes, self.Wcdes, self.PRdes, self.Etades)
         else:
             # scale the desig point map
@@ -131,12 +158,12 @@ class TTurboComponent(TGaspath):
             for angle, tmap in self.maps_by_angle.items():
                 # only scale the map (i.e. the design point map)
                 if not (tmap is self.map):
-                    tmap.ReadMap(tmap.map_filename)
+                    tmap.ReadMapIfNeeded()
                     tmap.SetScaling(SFnc, SFwc, SFpr, SFeta)
 
     # 1.6 WV
     def GetTurboMapPerformance(self, vg_angle, Nc, Beta):
-        if vg_angle == None:  # single map only in map object
+        if vg_angle is None:  # single map only in map object
             Wc, PR, Eta = self.map.GetScaledMapPerformance(Nc, Beta)
             return Wc, PR, Eta
         else:
@@ -162,7 +189,7 @@ class TTurboComponent(TGaspath):
 
     def PlotMaps(self): # Plot performance in map(s) override to add dual plotting option
         super().PlotMaps()
-        if self.map != None:
+        if self.map is not None:
             self.map.PlotDualMap(use_scaled_map = True, do_plot_design_point = True, do_plot_series = True)
             # 1.4
             # print(self.name + " map (dual) with operating curve saved in " + self.map.map_figure_file_path)
@@ -178,31 +205,24 @@ class TTurboComponent(TGaspath):
             self.vg_angle = self.vg_angle_des
 
     #  2.0
+    # 2.0.0.5 print formats from the map_data_print_formats and map_scaling_print_formats tables
     def print_map_data(self, map, mode):
-        if map.Ncmap!= None:
-            print(f"\tMap Corr Rotor speed : {map.Ncmap:.4f} rpm")
-        if map.Wcmapdes!= None:
-            print(f"\tDP Map Corr mass flow : {map.Wcmapdes:.3f} kg/s")
-        if map.Wcmap!= None:
-            print(f"\tMap Corr mass flow : {map.Wcmap:.3f} kg/s")
-        if map.PRmap!= None:
-            print(f"\tPR map : {map.PRmap:.4f}")
-        if map.Etamap!= None:
-            print(f"\tEta map : {map.Etamap:.4f}")
+        for name, print_format in map_data_print_formats:
+            value = getattr(map, name)
+            if value is not None:
+                print(print_format.format(value))
         if mode == 'DP':
-            print(f"\tSFmap Nc : {map.SFmap_Nc :.4f}")
-            print(f"\tSFmap Wc : {map.SFmap_Wc :.4f}")
-            print(f"\tSFmap PR : {map.SFmap_PR :.4f}")
-            print(f"\tSFmap Eta: {map.SFmap_Eta :.4f}")
+            for name, print_format in map_scaling_print_formats:
+                print(print_format.format(getattr(map, name)))
 
     def PrintPerformance(self, mode, PointTime):
         super().PrintPerformance(mode, PointTime)
         print(f"\tRotor speed  : {self.N:.0f} rpm")
         print(f"\tCorr Rotor speed : {self.Nc:.0f} rpm")
-        if self.map != None:
+        if self.map is not None:
             self.print_map_data(self.map, mode)
 
-        if self.Etades != None:
+        if self.Etades is not None:
             print(f"\tEta des : {self.Etades:.4f}")
             print(f"\tEta     : {self.Eta:.4f}")
 
@@ -212,22 +232,22 @@ class TTurboComponent(TGaspath):
     def get_outputs(self):
         out = super().get_outputs()
 
-        out[f"N{self.shaft_id}"] = self.N
-        out[f"Nc{self.station_in}"] = self.Nc
-        out[f"N{self.shaft_id}%"] = self.N/self.Ndes*100
-        out[f"Nc{self.station_in}%"] = self.Nc/self.Ncdes*100
+        out[self._key_N] = self.N
+        out[self._key_Nc] = self.Nc
+        out[self._key_N_pct] = self.N/self.Ndes*100
+        out[self._key_Nc_pct] = self.Nc/self.Ncdes*100
 
         # 1.5
-        if self.Eta != None:
-            out["Eta_is_"+self.name] = self.Eta
+        if self.Eta is not None:
+            out[self._key_Eta] = self.Eta
 
         # 1.6 WV
-        if self.vg_angle_des !=None:
-            out["vg_angle_"+self.name] = self.vg_angle
+        if self.vg_angle_des is not None:
+            out[self._key_vg_angle] = self.vg_angle
 
         # 2.0 OK
-        out["TQ"+self.name] = self.PW / (2 * math.pi * self.N / 60) if self.PW != None and self.N != None else None
+        out[self._key_TQ] = self.PW / (2 * math.pi * self.N / 60) if self.PW is not None and self.N is not None else None
 
-        out["PW_"+self.name] = self.PW
+        out[self._key_PW] = self.PW
 
         return out
\ No newline at end of file
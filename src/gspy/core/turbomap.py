@@ -13,13 +13,41 @@
 # Authors
 #   Oscar Kogenhop
 
+import os
+import re
 import numpy as np
-import matplotlib.pyplot as plt
 from gspy.core.map import TMap
-from scipy.interpolate import RegularGridInterpolator
+from scipy.interpolate import NdBSpline, make_interp_spline
 # from gspy.core import sys_global as fg
 
+# 2.0.0.5 map data (tables, interpolation functions etc.) read from map files, shared between map objects
+# reading the same unchanged map file (e.g. when models are created repeatedly in a parameter sweep).
+# key: (map class, map file path, file modification time), value: dict of the map_data_names attributes
+map_data_cache = {}
+MAP_DATA_CACHE_SIZE = 64
+
+# 2.0.0.5 values in the map file Reynolds line, e.g. "Reynolds: RNI=0.1 f=1 RNI=1 f=1"
+reynolds_values_re = re.compile(r'=\s*([-+\d.eE]+)')
+
+# 2.0.0.5 cubic not-a-knot tensor product spline through the values on the (nc_values, beta_values) grid,
+# extrapolating outside the grid, i.e. the spline of RegularGridInterpolator with method='cubic' and
+# fill_value=None, but with the coefficients solved directly one axis at a time.
+# values may have trailing dimensions (e.g. stacked tables), evaluating then returns all of them at once.
+def cubic_map_spline(grid, values):
+    coefs = np.asarray(values, dtype=float)
+    knots = []
+    for axis, axis_values in enumerate(grid):
+        spline = make_interp_spline(axis_values, coefs, k=3, axis=axis)
+        knots.append(spline.t)
+        # make_interp_spline returns the coefficients with the interpolation axis first
+        coefs = np.moveaxis(spline.c, 0, axis)
+    return NdBSpline(tuple(knots), coefs, 3, extrapolate=True)
+
 class TTurboMap(TMap):
+    # 2.0.0.5 names of the map data attributes set by ReadMap that are stored in map_data_cache,
+    # extend in child classes reading additional map data
+    map_data_names = ('nc_values', 'beta_values', 'wc_array', 'eta_array', 'pr_array', 'get_map_wc_eta_pr')
+
     def __init__(self, host_component, name, MapFileName, OL_xcol, OL_Ycol, ShaftString, Ncmapdes, Betamapdes):    # Constructor of the class
         super().__init__(host_component, name, MapFileName, OL_xcol, OL_Ycol)
         self.Ncmapdes = Ncmapdes
@@ -32,6 +60,11 @@ class TTurboMap(TMap):
         self.PRmap = None
         self.ShaftString = ShaftString
 
+        # 2.0.0.5 interpolation function for Wc, Eta and PR, defined once when the map is read
+        self.get_map_wc_eta_pr = None
+        # 2.0.0.5 (Nc, Beta) point buffer, shape (1, 2), for the single point map lookups during iteration
+        self.map_point = np.empty((1, 2), dtype=float)
+
         # Map scaling
         self.SFmap_Nc  = 1
         self.SFmap_Wc  = 1
@@ -130,16 +163,16 @@ class TTurboMap(TMap):
         amaptype, amaptitle, amapfile = super().ReadMap(filename)
         # with self.file:
         if self.map_file is not None:
-            line = self.map_file.readline()
-            while 'REYNOLDS' not in line.upper():
-                line = self.map_file.readline()
-            RNI = np.empty(2, dtype=float)
-            f_RNI = np.empty(2, dtype=float)
-            items = line.split()
-            RNI[0] = float(items[1].split("=", 1)[1])
-            f_RNI[0] = float(items[2].split("=", 1)[1])
-            RNI[1] = float(items[3].split("=", 1)[1])
-            f_RNI[1] = float(items[4].split("=", 1)[1])
+            # 2.0.0.5 jump to the Reynolds line in the map text
+            line, next_pos = self.FindMapTextLine('REYNOLDS', self.map_file.tell())
+            self.map_file.seek(next_pos)
+            # 2.0.0.5 get the 4 values (RNI, f, RNI, f) with a single regular expression scan
+            values = reynolds_values_re.findall(line)
+            if len(values) != 4:
+                raise ValueError(f"Invalid Reynolds line in map file {filename}: {line.strip()}")
+            values = np.array(values, dtype=float)
+            RNI = values[0::2]
+            f_RNI = values[1::2]
         return amaptype, amaptitle, amapfile
 
     def ReadNcBetaCrossTable(self, file, keyword):
@@ -152,56 +185,71 @@ class TTurboMap(TMap):
         nccount = round(nccount1)-1
         betacount = round(betacount1*1000)-1
 
-        beta_values = np.array(list(map(float, line.split()[1:])))
-        # read any beta values from subsequent lines until all added
-        while len(beta_values) < betacount:
+        # 2.0.0.5 collect the beta value items (also from any subsequent lines until all found)
+        # and convert them at once instead of growing the array with np.append for each line
+        beta_items = items[1:]
+        while len(beta_items) < betacount:
             line = file.readline()
-            beta_values = np.append(beta_values, np.array(list(map(float, line.split()[0:]))))
+            if not line:
+                raise ValueError(f"Unexpected end of map file reading '{keyword}' beta values")
+            beta_items.extend(line.split())
+        beta_values = np.array(beta_items, dtype=float)
+
+        # 2.0.0.5 collect the items of all nccount rows (Nc value followed by betacount values,
+        # a row may be wrapped over multiple lines) and convert them in a single numpy call
+        rowsize = betacount + 1
+        itemcount = nccount * rowsize
+        table_items = []
+        while len(table_items) < itemcount:
+            line = file.readline()
+            if not line:
+                raise ValueError(f"Unexpected end of map file reading '{keyword}' table: "
+                                 f"{len(table_items)} of {itemcount} values found")
+            table_items.extend(line.split())
+        table = np.array(table_items[:itemcount], dtype=float).reshape(nccount, rowsize)
+        nc_values = np.ascontiguousarray(table[:, 0])
+        fval_array = np.ascontiguousarray(table[:, 1:])
+        return nc_values, beta_values, fval_array
 
-        nc_values = np.empty(nccount, dtype=float)
-        fval_array = np.zeros((nccount, betacount), dtype=float)
-        line = file.readline()
-        inc = 0
-        while line.strip():
-            items = line.split()
-            nc_values[inc] = float(items[0])
-            # get a list of items from 1 or multiple lines
-            line_value_items = items[1:]
-            # read any items from subsequent lines for the same Nc until values for all Beta values added
-            while len(line_value_items) < betacount:
-                line = file.readline()
-                line_value_items = line_value_items + line.split()
-            # now assign all betacount items to the fval_array
-            fval_array[inc] = list(map(float, line_value_items))
-
-            # 1.6 WV check if need to read next line (avoid problems if no empty lines between cross tables)
-            # line = file.readline()
-            # inc +=1
-            inc +=1
-            if inc < nccount:
-                line = file.readline()
+    # 2.0.0.5 read the map and define the interpolation functions only once,
+    # not again for every DP run (e.g. during DP target iterations)
+    # Map data read before from the same unchanged file (by a map object of the same class) are taken from map_data_cache,
+    # the map arrays are made read-only since they are shared. Scaling factors remain specific to each map object.
+    def ReadMapIfNeeded(self):
+        if self.get_map_wc_eta_pr is None:
+            map_path = self.GetMapFilePath(self.map_filename)
+            cache_key = (type(self), str(map_path), os.path.getmtime(map_path))
+            map_data = map_data_cache.get(cache_key)
+            if map_data is None:
+                self.ReadMap(self.map_filename)
+                map_data = {name: getattr(self, name) for name in self.map_data_names}
+                for value in map_data.values():
+                    if isinstance(value, np.ndarray):
+                        value.setflags(write=False)
+                if len(map_data_cache) >= MAP_DATA_CACHE_SIZE:
+                    # remove oldest entry
+                    del map_data_cache[next(iter(map_data_cache))]
+                map_data_cache[cache_key] = map_data
             else:
-                break
-        return nc_values, beta_values, fval_array
+                vars(self).update(map_data)
 
     def ReadMapAndGetScaling(self, Ncdes, Wcdes, PRdes, Etades):
-        self.ReadMap(self.map_filename)
-        if self.map_file is not None:
-            # get map scaling parameters
-            # for Nc
-            self.SFmap_Nc = Ncdes / self.Ncmapdes
-            # for Wc
-            self.Wcmapdes = self.get_map_wc((self.Ncmapdes, self.Betamapdes))
-            self.SFmap_Wc = Wcdes / self.Wcmapdes
-            # for PR
-            self.PRmap = self.get_map_pr((self.Ncmapdes, self.Betamapdes))
-            self.SFmap_PR = (PRdes - 1) / (self.PRmap - 1)
-            # for Eta
-            self.Etamap = self.get_map_eta((self.Ncmapdes, self.Betamapdes))
-            self.SFmap_Eta = Etades / self.Etamap
-            return self.SFmap_Nc, self.SFmap_Wc, self.SFmap_PR, self.SFmap_Eta
-        else:
-            return 1, 1, 1, 1
+        # 2.0.0.5 ReadMapIfNeeded raises an exception if the map file cannot be read
+        self.ReadMapIfNeeded()
+        # get map scaling parameters
+        # for Nc
+        self.SFmap_Nc = Ncdes / self.Ncmapdes
+        # 2.0.0.5 Wc, Eta and PR map values at the map design point in a single lookup
+        self.map_point[0, 0] = self.Ncmapdes
+        self.map_point[0, 1] = self.Betamapdes
+        self.Wcmapdes, self.Etamap, self.PRmap = self.get_map_wc_eta_pr(self.map_point)[0]
+        # for Wc
+        self.SFmap_Wc = Wcdes / self.Wcmapdes
+        # for PR
+        self.SFmap_PR = (PRdes - 1) / (self.PRmap - 1)
+        # for Eta
+        self.SFmap_Eta = Etades / self.Etamap
+        return self.SFmap_Nc, self.SFmap_Wc, self.SFmap_PR, self.SFmap_Eta
 
     def SetScaling(self, SF_Nc, SF_Wc, SF_PR, SF_Eta):
         self.SFmap_Nc = SF_Nc
@@ -210,16 +258,19 @@ class TTurboMap(TMap):
         self.SFmap_Eta = SF_Eta
 
     def DefineInterpolationFunctions(self):
-        self.get_map_wc = RegularGridInterpolator((self.nc_values, self.beta_values), self.wc_array, bounds_error=False, fill_value=None, method = 'cubic')
-        self.get_map_eta = RegularGridInterpolator((self.nc_values, self.beta_values), self.eta_array, bounds_error=False, fill_value=None, method = 'cubic')
-        self.get_map_pr = RegularGridInterpolator((self.nc_values, self.beta_values), self.pr_array, bounds_error=False, fill_value=None, method = 'cubic')
+        # 2.0.0.5 Wc, Eta and PR tables stacked along a last axis in one spline: a map lookup then is
+        # a single call with one index search and one set of spline weights for all three values
+        self.get_map_wc_eta_pr = cubic_map_spline((self.nc_values, self.beta_values),
+                                                  np.stack((self.wc_array, self.eta_array, self.pr_array), axis=-1))
 
     def GetScaledMapPerformance(self, Nc, Beta_state):
         self.Ncmap = Nc / self.SFmap_Nc
         self.Betamap = Beta_state * self.Betamapdes
-        wcmap = self.get_map_wc((self.Ncmap, self.Betamap))
-        etamap = self.get_map_eta((self.Ncmap, self.Betamap))
-        prmap = self.get_map_pr((self.Ncmap, self.Betamap))
+        # 2.0.0.5 pass the single (Nc, Beta) point as a ready (1, 2) array: avoids the tuple to
+        # coordinate array conversion in each interpolator call and returns plain scalars
+        self.map_point[0, 0] = self.Ncmap
+        self.map_point[0, 1] = self.Betamap
+        wcmap, etamap, prmap = self.get_map_wc_eta_pr(self.map_point)[0]
         # v1.3 add % deltas for deterioration
         Wc = self.SFmap_Wc * wcmap          * self.SF_wc_deter
         Eta = self.SFmap_Eta * etamap       * self.SF_eta_deter
@@ -269,6 +320,8 @@ class TTurboMap(TMap):
         # override default
         self.map_figure_file_path = self.map_figure_dir_path / (self.name + '_dual' + '.jpg')
 
+        # 2.0.0.5 pyplot imported on first use, keeps it out of the model import time
+        import matplotlib.pyplot as plt
         # Create the subplot graph for a split turbomachinary plot
         self.dual_map_figure, (self.main_plot_axis, self.secondary_plot_axis) = plt.subplots(
             2, 1,                # two rows, one column
@@ -14,6 +14,7 @@
 #   Wilfried Visser
 
 import math
+import warnings
 import numpy as np
 from math import log, exp
 from scipy.optimize import root, root_scalar
@@ -35,7 +36,20 @@ def GetRotorspeedCorrectionFactor(gas: ct.Quantity):
 
 # multiply W by GetFlowCorrectionFactor to get Wc corrected
 def GetFlowCorrectionFactor(gas: ct.Quantity):
-    return math.sqrt(gas.T/c.T_std) / (gas.P/c.P_std)
+    # 2.0.0.5 single T, P read (each property read of a Quantity restores its state to the phase)
+    T, P = gas.TP
+    return GetFlowCorrectionFactorTP(T, P)
+
+# 2.0.0.5 flow correction factor for T, P values already read from the gas
+def GetFlowCorrectionFactorTP(T, P):
+    return math.sqrt(T/c.T_std) / (P/c.P_std)
+
+# 2.0.0.5 both correction factors with a single read of the gas state (T, P):
+# returns (GetRotorspeedCorrectionFactor(gas), GetFlowCorrectionFactor(gas))
+def GetCorrectionFactors(gas: ct.Quantity):
+    T, P = gas.TP
+    rotorspeed_factor = math.sqrt(T/c.T_std)
+    return rotorspeed_factor, rotorspeed_factor / (P/c.P_std)
 
 def set_enthalpy(gas, target_enthalpy):
     def equation(Titer):
@@ -47,6 +61,66 @@ def set_enthalpy(gas, target_enthalpy):
     else:
         print("Root not found")
 
+# 2.0.0.5 plain scalar secant iteration for solving func(x) = 0 (same steps and convergence
+# test as scipy.optimize.root_scalar method 'secant' in SciPy 1.17, without the wrapping overhead).
+# As in SciPy 1.17, a step with equal function values (flat func) returns the midpoint of the last
+# two points as not converged, with a RuntimeWarning if the points differ (older SciPy versions
+# returned the midpoint as converged).
+# f0 optional: func(x0) if already known.
+# Returns (x, converged)
+def secant_solve(func, x0, x1, f0=None, xtol=1e-6, maxiter=100):
+    p0, p1 = x0, x1
+    q0 = func(p0) if f0 is None else f0
+    q1 = func(p1)
+    if abs(q1) < abs(q0):
+        p0, p1, q0, q1 = p1, p0, q1, q0
+    for _ in range(maxiter):
+        if q1 == q0:
+            if p1 != p0:
+                warnings.warn(f"Tolerance of {p1 - p0} reached.", RuntimeWarning, stacklevel=2)
+            return (p1 + p0) / 2.0, False
+        if abs(q1) > abs(q0):
+            p = (-q0 / q1 * p1 + p0) / (1.0 - q0 / q1)
+        else:
+            p = (-q1 / q0 * p0 + p1) / (1.0 - q1 / q0)
+        if abs(p - p1) <= xtol:
+            return p, True
+        p0, q0 = p1, q1
+        p1 = p
+        q1 = func(p1)
+    return p1, False
+
+# 2.0.0.5 plain scalar Newton iteration for solving func(x) = 0, with func returning (f(x), df/dx)
+# (same steps and convergence test as scipy.optimize.root_scalar method 'newton' with fprime=True,
+# without the wrapping overhead).
+# bracket optional: (lower, upper) bounds of the root for a monotone func. The bounds are narrowed
+# with every iteration, Newton steps leaving the bounds are replaced by bisection steps.
+# Returns (x, converged)
+def newton_solve(func, x0, xtol=1.48e-8, maxiter=50, bracket=None):
+    if bracket is None:
+        lower, upper = -math.inf, math.inf
+    else:
+        lower, upper = bracket
+    p0 = x0
+    for _ in range(maxiter):
+        fval, fder = func(p0)
+        if fval == 0:
+            return p0, True
+        if fder == 0:
+            return p0, False
+        # root below p0 if f and df/dx have the same sign
+        if fval * fder > 0:
+            upper = p0
+        else:
+            lower = p0
+        p = p0 - fval / fder
+        if not (lower < p < upper):
+            p = 0.5 * (lower + upper)
+        if abs(p - p0) <= xtol:
+            return p, True
+        p0 = p
+    return p0, False
+
 def calculate_exit_velocity(gas, pressure_ratio):
     # Store the initial enthalpy for the stagnation state
     stagnation_enthalpy = gas.enthalpy_mass
@@ -66,6 +140,8 @@ def calculate_expansion_to_A(gas, pressure_ratio, A):
     # Store the initial enthalpy for the stagnation state
     stagnation_enthalpy = gas.enthalpy_mass
     stagnation_entropy = gas.entropy_mass
+    # 2.0.0.5 for the critical pressure initial guess in case of choked flow
+    stagnation_gamma = gas.cp_mass / gas.cv_mass
 
     # Calculate exit state based on the pressure ratio
     stagnation_pressure = gas.P
@@ -89,10 +165,12 @@ def calculate_expansion_to_A(gas, pressure_ratio, A):
     else:
         # exit_pressure = gas.P / pressure_ratio
         # keep entropy S constant
+        # 2.0.0.5 returns the error and its derivative to the throat pressure for Newton iteration
         def throat_H_error(Ps_throat):
             # 1.6.0.5
             # gas.SP = stagnation_entropy, Ps_throat  # Isentropic expansion to exit pressure
-            gas.SP = stagnation_entropy, float(np.asarray(Ps_throat).squeeze())  # Isentropic expansion to exit pressure
+            # 2.0.0.5 newton_solve passes Ps_throat as a single float value
+            gas.SP = stagnation_entropy, Ps_throat  # Isentropic expansion to exit pressure
 
             dh = stagnation_enthalpy - gas.enthalpy_mass
             # allow backwards flow during iteration (avoiding complex number for velocity)
@@ -101,14 +179,26 @@ def calculate_expansion_to_A(gas, pressure_ratio, A):
             else:
                 velocity = (2 * dh)**0.5
             velocity1 = gas.sound_speed
-            return velocity - velocity1
-        initial_guess = [stagnation_pressure/1.9] # 1.0 approx. critical PR
-        solution = root(throat_H_error, initial_guess)
+            # isentropic: dh/dP = 1/rho, so dV/dP = -1/(rho*|V|),
+            # and (ideal gas, frozen gamma) da/dP = a * (gamma-1) / (2*gamma*P)
+            gamma = gas.cp_mass / gas.cv_mass
+            derror_dP = (-1.0 / (gas.density * abs(velocity))
+                         - velocity1 * (gamma - 1.0) / (2.0 * gamma * Ps_throat))
+            return velocity - velocity1, derror_dP
+        # initial_guess = [stagnation_pressure/1.9] # 1.0 approx. critical PR
+        # solution = root(throat_H_error, initial_guess)
+        # 2.0.0.5 Newton iteration with analytical derivative instead of scipy root (finite difference Jacobian),
+        # from the ideal gas critical pressure (as in TExhaustNozzle DP), safeguarded with the root bracket:
+        # M >= 1 at exit_pressure, M = 0 at stagnation_pressure
+        initial_guess = max(stagnation_pressure * (2.0 / (stagnation_gamma + 1.0))**(stagnation_gamma / (stagnation_gamma - 1.0)),
+                            exit_pressure)
+        Ps_throat, converged = newton_solve(throat_H_error, initial_guess, xtol = 1e-8 * stagnation_pressure,
+                                            bracket = (exit_pressure, stagnation_pressure))
 
         massflow = A * gas.sound_speed * gas.density
         # Check if the solution converged
-        if solution.success:
-            return solution.x[0], gas.T, gas.sound_speed , massflow
+        if converged:
+            return Ps_throat, gas.T, gas.sound_speed , massflow
         else:
             raise ValueError("Solution throat P did not converge")
 
@@ -127,22 +217,25 @@ def exit_T_and_enthalpy_for_pressure_ratio(gas, target_PR, eta_is) :
     return gas.T, gas.enthalpy_mass
 
 def Compression(gas_in: ct.Quantity, gas_out: ct.Quantity, PR, Eta, Polytropic_Eta = 0):
+    # 2.0.0.5 gas_in properties read from its phase with a single state restore (each Quantity property
+    #         read restores the state), before setting gas_out changes the shared phase state
+    gas = gas_in.phase
+    Sin = gas.s
+    Hin = gas.enthalpy_mass
+    Pout = gas.P*PR
     # v1.4 polytropic efficiency option
     if Polytropic_Eta == 1:
-        R = ct.gas_constant / gas_in.phase.mean_molecular_weight
-        Sout = gas_in.s + R*log(PR)*(1/Eta-1)
-        Pout = gas_in.P*PR
+        R = ct.gas_constant / gas.mean_molecular_weight
+        Sout = Sin + R*log(PR)*(1/Eta-1)
         gas_out.SP = Sout, Pout # get gas_out at constant s and higher P
     else:
-        Sin = gas_in.s
-        Pout = gas_in.P*PR
         gas_out.SP = Sin, Pout # get gas_out at constant s and higher P
         his_out = gas_out.enthalpy_mass # isentropic exit specific enthalpy
-        Hout = gas_in.enthalpy_mass + (his_out - gas_in.enthalpy_mass) / Eta
+        Hout = Hin + (his_out - Hin) / Eta
         gas_out.HP = Hout, Pout
         # bug fix: for Fan, gas_out<>gas_in: use gas_out as the mass being compressed
         # PW = gas_out.H - gas_in.H
-    PW = gas_out.H - gas_out.mass * gas_in.phase.enthalpy_mass
+    PW = gas_out.H - gas_out.mass * Hin
     return PW
 
 def TurbineExpansion(gas_in: ct.Quantity, gas_out: ct.Quantity, PR, Eta, Wexp, Eta_Polytropic = 0):
@@ -170,7 +263,7 @@ def TurbineExpansion(gas_in: ct.Quantity, gas_out: ct.Quantity, PR, Eta, Wexp, E
         final_enthalpy = gas_in.enthalpy_mass - (gas_in.enthalpy_mass - final_enthalpy_is) * Eta
         gas_out.HP = final_enthalpy, Pout
         # if Wexp = None then assume mass flow in = mass flow out here (gas_in.mass = gas_out.mass), so:
-    if Wexp == None:
+    if Wexp is None:
         PW = gas_in.H - gas_out.H
     else:
         PW = Wexp * (gas_in.enthalpy_mass - gas_out.enthalpy_mass)
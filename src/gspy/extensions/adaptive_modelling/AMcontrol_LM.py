@@ -68,10 +68,8 @@ class TAMcontrol(TComponent):
                 self.powersettingcomppar = (self.powersettingcomppar[0], 'Wf')
 
             if self.powersettingcomppar[1] != 'Wf':
-                self.istate_Wf = self.owner.states.size
-                self.owner.states = np.append(self.owner.states, 1.0)   # Wf scale factor
-                self.owner.errors = np.append(self.owner.errors, 0.0)
-                self.ierror_powerset = self.owner.errors.size - 1
+                self.istate_Wf = self.owner.add_state(1.0)   # Wf scale factor
+                self.ierror_powerset = self.owner.add_error(0.0)
         else:
             # set ambient conditions
             for ambientcondpar in self.ambientparnamelist:
@@ -100,12 +98,12 @@ class TAMcontrol(TComponent):
         if mode == 'DP':
             #  add states and errors at end of existing states and errors of system model
             #  save the 1st index
-            self.first_map_mod_stateindex = self.owner.states.size
+            self.first_map_mod_stateindex = len(self.owner.states)
             for compmap, SFpar in self.mapmod_comps_pars_list:
                 # set the map modifier factors to 1 in case of multiple DP, OD calculations....
                 setattr(compmap, SFpar, 1)
-                self.owner.states = np.append(self.owner.states, 1)
-                self.owner.errors = np.append(self.owner.errors, 0)
+                self.owner.add_state()
+                self.owner.add_error()
             for parname in self.measparnamelist:
                 self.measpardesvalues = np.append(self.measpardesvalues, self.owner.output_dict[f"{parname}"])
 
@@ -0,0 +1,37 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from gspy.core.system import TSystemModel, DEFAULT_YAML
+
+DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+
+def create_model(tmp_path):
+    (tmp_path / 'data' / 'fluid_props').mkdir(parents=True)
+    shutil.copy(DATA_DIR / 'fluid_props' / DEFAULT_YAML, tmp_path / 'data' / 'fluid_props')
+    return TSystemModel('Ambient_test', model_file=str(tmp_path / 'model.py'))
+
+def ambient_values(ambient):
+    return {attr_name: getattr(ambient, attr_name) for attr_name in ambient._cached_attr_names}
+
+def test_unchanged_conditions_restore_state_and_attributes(tmp_path):
+    ambient = create_model(tmp_path).ambient
+    ambient.SetConditions('OD', 2000, 0.5, 15, None, None, RH=50)
+    expected_values = ambient_values(ambient)
+    expected_state = ambient.Gas_Ambient.state.copy()
+
+    # change the ambient attributes and gas state in between, as e.g. TAMcontrol does with setattr
+    for attr_name in ('Altitude', 'Macha', 'Tsa', 'Psa', 'Tta', 'Pta', 'V', 'RH'):
+        setattr(ambient, attr_name, -1)
+    ambient.Gas_Ambient.TP = 300, 1e5
+
+    ambient.SetConditions('OD', 2000, 0.5, 15, None, None, RH=50)
+    assert ambient_values(ambient) == expected_values
+    np.testing.assert_array_equal(ambient.Gas_Ambient.state, expected_state)
+
+    # same result when calculated again after other conditions
+    ambient.SetConditions('OD', 0, 0, 10, None, None)
+    ambient.SetConditions('OD', 2000, 0.5, 15, None, None, RH=50)
+    assert ambient_values(ambient) == expected_values
+    np.testing.assert_array_equal(ambient.Gas_Ambient.state, expected_state)
@@ -0,0 +1,91 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gspy.core.system import TSystemModel, DEFAULT_YAML
+from gspy.core.control import TControl
+from gspy.core.inlet import TInlet
+from gspy.core.fan import TFan
+from gspy.core.compressor import TCompressor
+from gspy.core.combustor import TCombustor
+from gspy.core.turbine import TTurbine
+from gspy.core.duct import TDuct
+from gspy.core.exhaustnozzle import TExhaustNozzle
+from gspy.core.exhaustdiffuser import TExhaustDiffuser
+from gspy.core.bleedflow import TBleedFlow
+from gspy.core.coolingflow import TCoolingFlow
+
+DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+
+def create_model(tmp_path, model_name):
+    # project dir with the data/maps and data/fluid_props dirs TSystemModel expects next to the model file
+    shutil.copytree(DATA_DIR / 'sample_maps', tmp_path / 'data' / 'maps')
+    (tmp_path / 'data' / 'fluid_props').mkdir()
+    shutil.copy(DATA_DIR / 'fluid_props' / DEFAULT_YAML, tmp_path / 'data' / 'fluid_props')
+    return TSystemModel(model_name, model_file=str(tmp_path / 'model.py'))
+
+def run_dp_and_od(model, fuel_control, altitude, macha):
+    model.mode = 'DP'
+    model.ambient.SetConditions('DP', 0, 0, 0, None, None)
+    model.Run_DP_simulation()
+    model.mode = 'OD'
+    model.input_points = fuel_control.get_OD_input_points()
+    model.ambient.SetConditions('OD', altitude, macha, 0, None, None)
+    model.Run_OD_simulation()
+
+def test_fan_cross_flow_reaches_downstream_components(tmp_path):
+    turbofan = create_model(tmp_path, 'Turbofan_cf')
+    # single OD point at 11 km / Ma 0.8, with BPR < BPRdes (bypass to core cross flow)
+    fuel_control = TControl(turbofan, 'Control', '', 1.11, 1600, None, None, None)
+    inlet = TInlet(turbofan, 'Inlet', '', None, 1, 2, 337, 1)
+    # cross flow control factor 0.5: part of the cross flow is mixed into the core flow
+    fan = TFan(turbofan, 'Fan_Bst', 'bigfanc.map', 2, 25, 21, 1, 4880, 0.8696, 5.3, 0.95, 0.7, 2.33,
+               'bigfand.map', 0.95, 0.7, 1.65, 0.8606, 0.5)
+    hpc = TCompressor(turbofan, 'HPC', 'compmap.map', None, 25, 3, 2, 14000, 0.8433, 1, 0.8, 10.9, 'GG', None)
+    combustor = TCombustor(turbofan, 'combustor', '', fuel_control, 3, 4, 1.1, 1500, 1, 1, None,
+                           43031, 1.9167, 0, None, None)
+    hpt = TTurbine(turbofan, 'HPT', 'turbimap.map', None, 4, 45, 2, 14000, 0.8732, 1, 0.65, 1.0, 'GG', None)
+    lpt = TTurbine(turbofan, 'LPT', 'turbimap.map', None, 45, 5, 1, 4480, 0.8682, 1, 0.7, 1.0, 'GG', None)
+    hot_duct = TDuct(turbofan, 'Exhduct_hot', '', None, 5, 7, 1.0)
+    hot_nozzle = TExhaustNozzle(turbofan, 'HotNozzle', '', None, 7, 8, 9, 1, 1, 1)
+    cold_duct = TDuct(turbofan, 'Exhduct_cold', '', None, 21, 23, 1.0)
+    cold_nozzle = TExhaustNozzle(turbofan, 'ColdNozzle', '', None, 23, 18, 19, 1, 1, 1)
+    turbofan.define_comp_run_list(fuel_control, inlet, fan, hpc, combustor, hpt, lpt,
+                                  hot_duct, hot_nozzle, cold_duct, cold_nozzle)
+    run_dp_and_od(turbofan, fuel_control, 11000, 0.8)
+
+    assert fan.OD_crossFlow is not None and fan.OD_crossFlow.mass > 0
+    gaspath_conditions = turbofan.gaspath_conditions
+    assert gaspath_conditions[25] is fan.gas_out
+    assert hpc.gas_in is fan.gas_out
+    assert gaspath_conditions[2].mass == pytest.approx(gaspath_conditions[25].mass + gaspath_conditions[21].mass)
+
+def test_turbine_cooling_flows_mixed_into_gas_out(tmp_path):
+    turboshaft = create_model(tmp_path, 'Turboshaft_cool')
+    fuel_control = TControl(turboshaft, 'Control', '', 2.5, 2.2, None, None, None)
+    inlet = TInlet(turboshaft, 'Inlet1', '', None, 0, 2, 100, 0.9901311)
+    compressor_bleeds = [TBleedFlow(turboshaft, 'IPbleed', None, None, 23, 24, 1, 0.04, 0.6),
+                         TBleedFlow(turboshaft, 'HPbleed', None, None, 31, 32, 2, 0.06, 1.0)]
+    compressor = TCompressor(turboshaft, 'compressor1', 'compmap.map', None, 2, 3, '_gg', 6800, 0.9, 1, 0.79, 18,
+                             'GG', compressor_bleeds)
+    combustor = TCombustor(turboshaft, 'combustor1', '', fuel_control, 3, 4, 2.5, None, 0.95, 0.9998, 340.00,
+                           50025, 4, 0, 'CH4:1', None)
+    ggt_cooling_flows = [TCoolingFlow(turboshaft, 'GGTcooling1', None, None, 32, 35, 1, 2, 0.8, 1.0, 0.8, 0.2),
+                         TCoolingFlow(turboshaft, 'GGTcooling2', None, None, 32, 36, 2, 2, 0.2, 0.4, 0.5, 0.14)]
+    turbine_gg = TTurbine(turboshaft, 'GGT', 'turbimap.map', None, 4, 45, '_gg', 6800, 0.83, 1, 0.6, 0.99, 'GG',
+                          ggt_cooling_flows)
+    pt_cooling_flows = [TCoolingFlow(turboshaft, 'PTcooling1', None, None, 24, 38, 3, 1, 1, 0.75, 1.0, 0)]
+    turbine_pt = TTurbine(turboshaft, 'PT', 'turbimap.map', None, 45, 5, '_pt', 4100, 0.9, 1, 0.8, 0.98, 'PT',
+                          pt_cooling_flows)
+    duct = TDuct(turboshaft, 'exhduct', '', None, 5, 7, 0.98)
+    exhaust = TExhaustDiffuser(turboshaft, 'exhaust1', '', None, 7, 9, 1)
+    turboshaft.define_comp_run_list(fuel_control, inlet, compressor, combustor, turbine_gg, turbine_pt, duct, exhaust)
+    run_dp_and_od(turboshaft, fuel_control, 0, 0)
+
+    gaspath_conditions = turboshaft.gaspath_conditions
+    for turbine in (turbine_gg, turbine_pt):
+        assert gaspath_conditions[turbine.station_out] is turbine.gas_out
+        cooling_mass = sum(cf.gas_out.mass for cf in turbine.CoolingFlows)
+        assert turbine.gas_out.mass == pytest.approx(turbine.gas_in.mass + cooling_mass)
+    assert turbine_pt.gas_in is turbine_gg.gas_out
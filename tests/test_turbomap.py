@@ -0,0 +1,50 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy.interpolate import RegularGridInterpolator
+from scipy.sparse.linalg import spsolve
+
+from gspy.core.compressormap import TCompressorMap
+from gspy.core.turbinemap import TTurbineMap
+
+SAMPLE_MAPS_DIR = Path(__file__).resolve().parents[1] / 'data' / 'sample_maps'
+
+def create_map(map_class, map_filename):
+    owner = SimpleNamespace(maps_dir_path=SAMPLE_MAPS_DIR, output_dir_path=SAMPLE_MAPS_DIR)
+    host_component = SimpleNamespace(owner=owner, name='test', station_in=2)
+    amap = map_class(host_component, 'test_map', map_filename, '', '', '', 1.0, 0.5)
+    amap.ReadMap(map_filename)
+    return amap
+
+def map_test_points(amap):
+    # points inside the map and (extrapolation) outside the map in all directions
+    nc_min, nc_max = amap.nc_values[0], amap.nc_values[-1]
+    nc_range = nc_max - nc_min
+    nc = np.linspace(nc_min - 0.2 * nc_range, nc_max + 0.2 * nc_range, 15)
+    beta = np.linspace(-0.2, 1.2, 15)
+    return np.stack(np.meshgrid(nc, beta, indexing='ij'), axis=-1).reshape(-1, 2)
+
+@pytest.mark.parametrize('map_class, map_filename', [(TCompressorMap, 'compmap.map'),
+                                                     (TTurbineMap, 'turbimap.map')])
+def test_single_point_map_lookup_equals_interpolator(map_class, map_filename):
+    amap = create_map(map_class, map_filename)
+    grid = (amap.nc_values, amap.beta_values)
+    get_map_wc = RegularGridInterpolator(grid, amap.wc_array, bounds_error=False, fill_value=None, method='cubic', solver=spsolve)
+    get_map_eta = RegularGridInterpolator(grid, amap.eta_array, bounds_error=False, fill_value=None, method='cubic', solver=spsolve)
+    get_map_pr = RegularGridInterpolator(grid, amap.pr_array, bounds_error=False, fill_value=None, method='cubic', solver=spsolve)
+    for Ncmap, Betamap in map_test_points(amap):
+        Wc, PR, Eta = amap.GetScaledMapPerformance(Ncmap, Betamap / amap.Betamapdes)
+        point = (Ncmap, Betamap)
+        np.testing.assert_allclose(Wc, get_map_wc(point), rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(Eta, get_map_eta(point), rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(PR, get_map_pr(point), rtol=1e-9, atol=1e-9)
+
+def test_map_spline_passes_through_map_table_values():
+    amap = create_map(TCompressorMap, 'compmap.map')
+    nc, beta = np.meshgrid(amap.nc_values, amap.beta_values, indexing='ij')
+    values = amap.get_map_wc_eta_pr(np.stack((nc, beta), axis=-1))
+    np.testing.assert_allclose(values[..., 0], amap.wc_array, rtol=1e-9)
+    np.testing.assert_allclose(values[..., 1], amap.eta_array, rtol=1e-9)
+    np.testing.assert_allclose(values[..., 2], amap.pr_array, rtol=1e-9)
@@ -0,0 +1,52 @@
+import math
+
+import pytest
+from scipy.optimize import root_scalar
+
+from gspy.core.utils import secant_solve, newton_solve
+
+def cubic(x):
+    return x**3 - 2*x - 5
+
+def cubic_and_derivative(x):
+    return x**3 - 2*x - 5, 3*x**2 - 2
+
+def test_secant_solve_equals_root_scalar():
+    solution = root_scalar(cubic, method='secant', x0=1.0, x1=3.0, xtol=1e-6, maxiter=100)
+    x, converged = secant_solve(cubic, 1.0, 3.0, xtol=1e-6, maxiter=100)
+    assert converged and solution.converged
+    assert x == solution.root
+    # same result with func(x0) passed in
+    assert secant_solve(cubic, 1.0, 3.0, f0=cubic(1.0), xtol=1e-6, maxiter=100) == (x, True)
+
+def test_secant_solve_flat_function_step():
+    def flat(x):
+        return 1.0
+    with pytest.warns(RuntimeWarning):
+        solution = root_scalar(flat, method='secant', x0=1.0, x1=3.0, xtol=1e-6)
+    with pytest.warns(RuntimeWarning):
+        x, converged = secant_solve(flat, 1.0, 3.0, xtol=1e-6)
+    assert (x, converged) == (solution.root, solution.converged)
+    assert (x, converged) == (2.0, False)
+
+def test_secant_solve_maxiter():
+    x, converged = secant_solve(cubic, 1.0, 3.0, xtol=1e-6, maxiter=2)
+    assert not converged
+
+def test_newton_solve_equals_root_scalar():
+    solution = root_scalar(cubic_and_derivative, method='newton', fprime=True, x0=3.0, xtol=1.48e-8, maxiter=50)
+    x, converged = newton_solve(cubic_and_derivative, 3.0)
+    assert converged and solution.converged
+    assert x == solution.root
+
+def test_newton_solve_bracket():
+    # plain Newton steps from x0 = 5 overshoot further away from the root x = 1 every iteration,
+    # steps leaving the bracket are replaced by bisection steps
+    def atan_and_derivative(x):
+        return math.atan(x - 1), 1 / (1 + (x - 1)**2)
+    x, converged = newton_solve(atan_and_derivative, 5.0, bracket=(-10.0, 10.0))
+    assert converged
+    assert x == pytest.approx(1.0, abs=1e-8)
+
+def test_newton_solve_zero_derivative():
+    assert newton_solve(lambda x: (1.0, 0.0), 2.0) == (2.0, False)